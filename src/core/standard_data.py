@@ -4,7 +4,7 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataPoint:
     """Representa um único ponto de dados de telemetria em um instante."""
     timestamp_ms: int = 0
@@ -32,7 +32,7 @@ class DataPoint:
     tyre_press_rr: Optional[float] = None
     # ... outros canais padronizados
 
-@dataclass
+@dataclass(slots=True)
 class LapData:
     """Representa os dados de uma única volta."""
     lap_number: int
@@ -67,7 +67,7 @@ class SessionInfo:
     # Outros metadados relevantes
     weather: Optional[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(slots=True)
 class TelemetrySession:
     """Estrutura completa para uma sessão de telemetria padronizada."""
     session_info: SessionInfo
@@ -223,11 +223,7 @@ class TelemetryNormalizer:
                     )
 
                 # Cria pontos de dados da volta
-                data_points = []
-                for j in range(start_idx, end_idx):
-                    point_data = self._create_data_point(channels, j, lap_start_time)
-                    if point_data:
-                        data_points.append(point_data)
+                data_points = self._create_lap_data_points(channels, start_idx, end_idx, lap_start_time)
 
                 if data_points:
                     lap_data = LapData(
@@ -244,59 +240,56 @@ class TelemetryNormalizer:
 
         return laps_data
 
-    def _create_data_point(self, channels: Dict[str, np.ndarray], index: int, lap_start_time: float) -> Optional[DataPoint]:
-        """Cria um ponto de dados a partir dos canais."""
+    def _create_lap_data_points(self, channels: Dict[str, np.ndarray], start_idx: int, end_idx: int,
+                                lap_start_time: float) -> List[DataPoint]:
+        """Cria os pontos de dados de uma volta a partir de colunas, na ordem dos campos do DataPoint."""
         try:
-            # Campos obrigatórios com valores padrão
-            point_data = {
-                'timestamp_ms': int(channels.get('timestamp_s', [0])[index] * 1000) if 'timestamp_s' in channels else 0,
-                'distance_m': float(channels.get('distance_m', [0.0])[index]) if 'distance_m' in channels else 0.0,
-                'lap_time_ms': int((channels.get('timestamp_s', [lap_start_time])[index] - lap_start_time) * 1000) if 'timestamp_s' in channels else 0,
-                'sector': int(channels.get('sector', [0])[index]) if 'sector' in channels else 0,
-                'pos_x': float(channels.get('pos_x', [0.0])[index]) if 'pos_x' in channels else 0.0,
-                'pos_y': float(channels.get('pos_y', [0.0])[index]) if 'pos_y' in channels else 0.0,
-                'pos_z': float(channels.get('pos_z', [0.0])[index]) if 'pos_z' in channels else 0.0,
-                'speed_kmh': float(channels.get('speed_kmh', [0.0])[index]) if 'speed_kmh' in channels else 0.0,
-                'rpm': int(channels.get('rpm', [0])[index]) if 'rpm' in channels else 0,
-                'gear': int(channels.get('gear', [0])[index]) if 'gear' in channels else 0,
-                'throttle': float(channels.get('throttle', [0.0])[index]) if 'throttle' in channels else 0.0,
-                'brake': float(channels.get('brake', [0.0])[index]) if 'brake' in channels else 0.0,
-                'steer_angle': float(channels.get('steer_angle', [0.0])[index]) if 'steer_angle' in channels else 0.0,
-                'clutch': float(channels.get('clutch', [0.0])[index]) if 'clutch' in channels else 0.0,
-            }
-
-            # Adiciona campos extras se disponíveis  
-            extra_fields = {
-                'lat_g': 'lat_g',
-                'long_g': 'long_g', 
-                'vert_g': 'vert_g',
-                'susp_pos_fl': 'susp_pos_fl',
-                'susp_pos_fr': 'susp_pos_fr',
-                'susp_pos_rl': 'susp_pos_rl',
-                'susp_pos_rr': 'susp_pos_rr',
-                'tyre_temp_fl': 'tyre_temp_fl',
-                'tyre_temp_fr': 'tyre_temp_fr',
-                'tyre_temp_rl': 'tyre_temp_rl',
-                'tyre_temp_rr': 'tyre_temp_rr',
-                'tyre_press_fl': 'tyre_press_fl',
-                'tyre_press_fr': 'tyre_press_fr',
-                'tyre_press_rl': 'tyre_press_rl',
-                'tyre_press_rr': 'tyre_press_rr',
-            }
-
-            for field, channel_name in extra_fields.items():
-                if channel_name in channels and index < len(channels[channel_name]):
-                    point_data[field] = float(channels[channel_name][index])
-
-            # Filtra apenas campos válidos do DataPoint
-            allowed_keys = DataPoint.__annotations__.keys()
-            filtered_data = {k: v for k, v in point_data.items() if k in allowed_keys}
-
-            return DataPoint(**filtered_data)
-
+            columns = [
+                self._lap_column(channels, field, field_type, start_idx, end_idx, lap_start_time)
+                for field, field_type in DataPoint.__annotations__.items()
+            ]
+            return [DataPoint(*values) for values in zip(*columns)]
         except Exception as e:
-            logger.error(f"Erro ao criar DataPoint no índice {index}: {e}")
-            return None
+            logger.error(f"Erro ao criar DataPoints entre os índices {start_idx} e {end_idx}: {e}")
+            return []
+
+    def _lap_column(self, channels: Dict[str, np.ndarray], field: str, field_type: Any,
+                    start_idx: int, end_idx: int, lap_start_time: float) -> List[Any]:
+        """Retorna os valores de um campo do DataPoint para as amostras [start_idx, end_idx)."""
+        num_points = end_idx - start_idx
+
+        if field in ("timestamp_ms", "lap_time_ms"):
+            if "timestamp_s" not in channels:
+                return [0] * num_points
+            seconds = channels["timestamp_s"][start_idx:end_idx]
+            if field == "lap_time_ms":
+                seconds = seconds - lap_start_time
+            values = self._int_column(seconds * 1000, 0)
+            values.extend([0] * (num_points - len(values)))
+            return values
+
+        default = DataPoint.__dataclass_fields__[field].default
+        if field not in channels:
+            return [default] * num_points
+
+        values = channels[field][start_idx:end_idx]
+        if field_type is int:
+            values = self._int_column(values, default)
+        else:
+            values = values.astype(np.float64).tolist()
+        if len(values) < num_points:
+            # Canal mais curto que a volta: completa com o valor padrão do campo
+            values.extend([default] * (num_points - len(values)))
+        return values
+
+    @staticmethod
+    def _int_column(values: np.ndarray, default: int) -> List[int]:
+        """Converte uma coluna para int; amostras NaN/inf viram `default` em vez de lixo do cast."""
+        values = np.asarray(values, dtype=np.float64)
+        finite = np.isfinite(values)
+        if not finite.all():
+            values = np.where(finite, values, default)
+        return values.astype(np.int64).tolist()
 
     def _calculate_sector_times(self, sectors: np.ndarray, timestamps: np.ndarray, 
                               distances: np.ndarray, track_data: TrackData) -> List[int]:
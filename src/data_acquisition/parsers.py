@@ -4,11 +4,13 @@
 import logging
 import struct
 import os
+import mmap
 import datetime
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from typing import Optional, Dict, Any, List, Tuple, Callable
 import numpy as np
-import pandas as pd
 
 # Importa a estrutura de dados padronizada
 from src.core.standard_data import TelemetrySession, SessionInfo, TrackData, LapData, DataPoint
@@ -17,15 +19,66 @@ logger = logging.getLogger(__name__)
 
 # --- Funções Auxiliares ---
 def decode_string(byte_string: bytes) -> str:
-    """Decodifica bytes para string, removendo nulos e espaços extras."""
-    try:
-        return byte_string.decode("utf-8", errors="ignore").strip().rstrip("\0").strip()
-    except Exception:
-        try:
-            return byte_string.decode("latin-1", errors="ignore").strip().rstrip("\0").strip()
-        except Exception as e:
-            logger.warning(f"Falha ao decodificar string: {byte_string}. Erro: {e}")
-            return ""
+    """Decodifica bytes para string, parando no primeiro nulo e removendo espaços extras."""
+    return byte_string.partition(b"\x00")[0].decode("utf-8", "replace").strip()
+
+# Campos do DataPoint, materializados uma única vez na importação
+_DP_FIELDS: Tuple[str, ...] = tuple(DataPoint.__annotations__)
+_DP_FIELD_SET = frozenset(_DP_FIELDS)
+
+# Campos inteiros do DataPoint (convertidos para int64 pelo numpy antes da montagem)
+_DP_INT_FIELDS = frozenset(name for name, tp in DataPoint.__annotations__.items() if tp is int)
+
+# Funções de montagem geradas em tempo de execução, por conjunto de canais
+_PACKER_CACHE: Dict[Tuple[str, ...], Callable[..., List[DataPoint]]] = {}
+
+def _compile_packer(keys: Tuple[str, ...]) -> Callable[..., List[DataPoint]]:
+    """Gera uma função que monta DataPoints para um conjunto fixo de canais.
+
+    O conjunto de canais não muda dentro de um arquivo, então a função gerada
+    acessa diretamente apenas as colunas presentes, sem checar chaves a cada amostra.
+    As colunas já chegam com o tipo final (ver `_typed_column`), então não há conversão por amostra.
+    """
+    packer = _PACKER_CACHE.get(keys)
+    if packer is not None:
+        return packer
+
+    cols = [f"c{i}" for i in range(len(keys))]
+    vals = [f"v{i}" for i in range(len(keys))]
+    kwargs = []
+    for key, val in zip(keys, vals):
+        field_name = "timestamp_ms" if key == "timestamp_s" else key
+        kwargs.append(f"{field_name}={val}")
+
+    if keys:
+        body = (f"    return [DataPoint({', '.join(kwargs)}) "
+                f"for {', '.join(vals)}, in zip({', '.join(cols)})]\n")
+    else:
+        body = "    return [DataPoint() for _ in range(n)]\n"
+    src = f"def _pack({', '.join(['n'] + cols)}):\n{body}"
+
+    namespace: Dict[str, Any] = {"DataPoint": DataPoint}
+    exec(src, namespace)
+    packer = namespace["_pack"]
+    _PACKER_CACHE[keys] = packer
+    return packer
+
+def _typed_column(key: str, values: np.ndarray) -> List[Any]:
+    """Converte uma coluna inteira para o tipo do campo do DataPoint numa única operação numpy."""
+    if key == "timestamp_s":
+        return (values.astype(np.float64) * 1000).astype(np.int64).tolist()
+    if key in _DP_INT_FIELDS:
+        return values.astype(np.int64).tolist()
+    return values.tolist()
+
+def _pack_data_points(columns: Dict[str, np.ndarray], n: int) -> List[DataPoint]:
+    """Monta os DataPoints das primeiras `n` amostras das colunas padronizadas."""
+    keys = tuple(k for k in columns if k in _DP_FIELD_SET or k == "timestamp_s")
+    if "timestamp_s" in keys:
+        # O timestamp em segundos tem precedência sobre um canal timestamp_ms
+        keys = tuple(k for k in keys if k != "timestamp_ms")
+    packer = _compile_packer(keys)
+    return packer(n, *(_typed_column(k, columns[k][:n]) for k in keys))
 
 # --- Classes Base ---
 class BaseParser(ABC):
@@ -42,6 +95,237 @@ class BaseParser(ABC):
 # Para máxima compatibilidade, recomenda-se exportar os dados para CSV usando o MoTeC i2 Pro
 # e importar o CSV, ou converter para formatos abertos.
 
+# --- Estruturas internas do formato MoTeC LD/LDX ---
+# Todas as leituras do .ld são feitas sobre um único mmap do arquivo (memoryview),
+# sem abrir o arquivo novamente por canal ou por volta.
+
+class _ldHead:
+    """Cabeçalho do arquivo .ld (layout do ldparser)."""
+
+    fmt = "<" + (
+        "I4x"     # ldmarker
+        "II"      # chann_meta_ptr chann_data_ptr
+        "20x"     # ??
+        "I"       # event_ptr
+        "24x"     # ??
+        "HHH"     # números estáticos desconhecidos
+        "I"       # device serial
+        "8s"      # device type
+        "H"       # device version
+        "H"       # número estático desconhecido
+        "I"       # num_channs
+        "4x"      # ??
+        "16s"     # date
+        "16x"     # ??
+        "16s"     # time
+        "16x"     # ??
+        "64s"     # driver
+        "64s"     # vehicleid
+        "64x"     # ??
+        "64s"     # venue
+        "64x"     # ??
+        "1024x"   # ??
+        "I"       # "pro logging" (número mágico?)
+        "66x"     # ??
+        "64s"     # short comment
+        "126x"    # ??
+    )
+
+    def __init__(self, mv: memoryview):
+        self.meta_ptr = 0
+        self.data_ptr = 0
+        self.num_channels = 0
+        self.driver = ""
+        self.vehicleid = ""
+        self.venue = ""
+        self.short_comment = ""
+        self.datetime: Optional[datetime.datetime] = None
+        self.event_name = ""
+        self.event_session = ""
+        self.event_comment = ""
+        self._read_header(mv)
+
+    def _read_header(self, mv: memoryview):
+        (_, self.meta_ptr, self.data_ptr, self.event_ptr,
+         _, _, _,
+         _, _, _, _, self.num_channels,
+         date, time,
+         driver, vehicleid, venue,
+         _, short_comment) = _LDHEAD.unpack_from(mv, 0)
+
+        self.driver = decode_string(driver)
+        self.vehicleid = decode_string(vehicleid)
+        self.venue = decode_string(venue)
+        self.short_comment = decode_string(short_comment)
+
+        date_str = decode_string(date)
+        time_str = decode_string(time)
+        for dt_fmt in ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M"):
+            try:
+                self.datetime = datetime.datetime.strptime(f"{date_str} {time_str}", dt_fmt)
+                break
+            except ValueError:
+                continue
+
+        if 0 < self.event_ptr and self.event_ptr + _LDEVENT.size <= len(mv):
+            name, session, comment, _ = _LDEVENT.unpack_from(mv, self.event_ptr)
+            self.event_name = decode_string(name)
+            self.event_session = decode_string(session)
+            self.event_comment = decode_string(comment)
+
+# Cabeçalho do arquivo e registro de evento pré-compilados
+_LDHEAD = struct.Struct(_ldHead.fmt)
+_LDEVENT = struct.Struct("<64s64s1024sH")  # name session comment venue_ptr
+
+
+class _ldChan:
+    """Metadados de um canal do .ld e acesso aos seus dados."""
+
+    fmt = "<" + (
+        "IIII"    # prev_addr next_addr data_ptr n_data
+        "H"       # contador?
+        "HHH"     # datatype datatype rec_freq
+        "hhhh"    # shift mul scale dec_places
+        "32s"     # name
+        "8s"      # short name
+        "12s"     # unit
+        "40x"     # ? (40 bytes para ACC, 32 bytes para acti)
+    )
+
+    def __init__(self, mv: memoryview, meta_ptr: int):
+        self._mv = mv
+        self.meta_ptr = meta_ptr
+        self.np_dtype = None
+        self._read_header()
+
+    def _read_header(self):
+        (self.prev_meta_ptr, self.next_meta_ptr, self.data_ptr, self.data_len,
+         _, dtype_a, dtype, self.freq,
+         self.shift, self.mul, self.scale, self.dec,
+         name, short_name, unit) = _CHAN_UNPACK(self._mv, self.meta_ptr)
+
+        self.name = decode_string(name)
+        self.short_name = decode_string(short_name)
+        self.unit = decode_string(unit)
+
+        # (raw / scale * 10^-dec + shift) * mul  ==  raw * _a + _b
+        # (escala 0 não é válida no formato; tratada como 1)
+        self._a = (self.mul / (self.scale or 1)) * (10.0 ** -self.dec)
+        self._b = self.mul * self.shift
+
+        if dtype_a == 0x07:
+            self.np_dtype = {2: np.float16, 4: np.float32}.get(dtype)
+        elif dtype_a in (0x00, 0x03, 0x05):
+            self.np_dtype = {2: np.int16, 4: np.int32}.get(dtype)
+        self._itemsize = np.dtype(self.np_dtype).itemsize if self.np_dtype else 0
+
+    def get_data(self, start_index: int = 0, count: Optional[int] = None,
+                 out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Retorna `count` amostras convertidas a partir de `start_index` (todas por padrão).
+
+        Se `out` (float32, com pelo menos `count` posições) for informado, a conversão é
+        feita nele e a view `out[:count]` é retornada, permitindo reutilizar o buffer.
+        """
+        if count is None:
+            count = self.data_len - start_index
+        if start_index < 0 or count <= 0 or start_index + count > self.data_len:
+            logger.warning("Intervalo inválido para o canal %s: start=%d, count=%d, total=%d",
+                           self.name, start_index, count, self.data_len)
+            return None
+        if not self.np_dtype:
+            logger.warning("Tipo de dado desconhecido para o canal %s", self.name)
+            return None
+        offset = self.data_ptr + start_index * self._itemsize
+        if offset + count * self._itemsize > len(self._mv):
+            logger.warning("Dados do canal %s ultrapassam o fim do arquivo (offset=0x%08x, count=%d)",
+                           self.name, offset, count)
+            return None
+
+        raw_data = np.frombuffer(self._mv, dtype=self.np_dtype, count=count, offset=offset)
+        # Converte direto para float32 num único buffer (sem temporários intermediários)
+        if out is None:
+            out = np.empty(count, dtype=np.float32)
+        else:
+            out = out[:count]
+        np.multiply(raw_data, np.float32(self._a), out=out, dtype=np.float32)
+        out += np.float32(self._b)
+        return out
+
+# Formato do registro de canal pré-compilado (lido uma vez por canal na lista encadeada)
+_CHAN_UNPACK = struct.Struct(_ldChan.fmt).unpack_from
+
+
+class _ldxLapInfo:
+    """Início/fim (em amostras) e tempo de uma volta lidos do .ldx."""
+
+    # Tamanho do cabeçalho antes da tabela de voltas (engenharia reversa, pode variar)
+    header_size_guess = 0x10
+    lap_record_fmt = "<IIf"  # start_offset end_offset lap_time_s
+    lap_record_size = struct.calcsize(lap_record_fmt)
+
+    def __init__(self, lap_num: int, start_offset: int, end_offset: int, lap_time_s: float):
+        self.lap_num = lap_num
+        self.start_offset = start_offset
+        self.end_offset = end_offset
+        self.lap_time_s = lap_time_s
+
+
+# Registro da tabela de voltas como dtype estruturado (mesmo layout de `_ldxLapInfo.lap_record_fmt`)
+_LDX_DTYPE = np.dtype([("start", "<u4"), ("end", "<u4"), ("time", "<f4")])
+
+def _parse_ldx(file_path: str) -> Optional[List[_ldxLapInfo]]:
+    """Lê a tabela de voltas de um arquivo .ldx."""
+    try:
+        with open(file_path, "rb") as f:
+            if hasattr(os, "pread"):
+                # Leitura posicional única (sem o par seek + read); indisponível no Windows
+                size = os.fstat(f.fileno()).st_size - _ldxLapInfo.header_size_guess
+                buf = os.pread(f.fileno(), max(size, 0), _ldxLapInfo.header_size_guess)
+            else:
+                f.seek(_ldxLapInfo.header_size_guess)
+                buf = f.read()
+    except OSError as e:
+        logger.error("Erro ao ler arquivo LDX %s: %s", file_path, e)
+        return None
+
+    # A tabela inteira vira um array estruturado (um registro <IIf por volta)
+    records = np.frombuffer(buf, dtype=_LDX_DTYPE, count=len(buf) // _LDX_DTYPE.itemsize)
+    valid = (records["start"] < records["end"]) & (records["time"] > 0)
+
+    invalid_count = len(records) - int(np.count_nonzero(valid))
+    if invalid_count:
+        logger.warning("%d registros de volta inválidos ignorados no LDX", invalid_count)
+
+    laps = [_ldxLapInfo(lap_num, start_offset, end_offset, lap_time_s)
+            for lap_num, (start_offset, end_offset, lap_time_s) in enumerate(records[valid].tolist(), start=1)]
+
+    logger.info("%d voltas lidas do arquivo LDX", len(laps))
+    return laps
+
+# Sessões MoTeC já processadas, por (caminho, mtime_ns, tamanho) do .ld e do .ldx (LRU)
+_PARSE_CACHE: "OrderedDict[Tuple[Any, ...], TelemetrySession]" = OrderedDict()
+_PARSE_CACHE_SIZE = 8
+
+def _copy_session(session: TelemetrySession) -> TelemetrySession:
+    """Cópia rasa da sessão com listas próprias, para que quem recebe possa alterá-la sem
+    mexer na entrada do cache (os DataPoints são imutáveis e continuam compartilhados)."""
+    info = session.session_info
+    track = session.track_data
+    return TelemetrySession(
+        session_info=replace(info, weather=dict(info.weather) if info.weather is not None else None),
+        track_data=replace(track, sector_markers_m=list(track.sector_markers_m),
+                           track_map_coords=list(track.track_map_coords) if track.track_map_coords is not None else None),
+        laps=[replace(lap, sector_times_ms=list(lap.sector_times_ms), data_points=list(lap.data_points))
+              for lap in session.laps],
+    )
+
+def _file_signature(path: Optional[str]) -> Optional[Tuple[str, int, int]]:
+    """Identifica uma versão de arquivo pelo caminho absoluto, mtime e tamanho."""
+    if not path:
+        return None
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
 class MotecParser(BaseParser):
     """Parser para arquivos MoTeC .ld (com suporte opcional a .ldx).
     Baseado em engenharia reversa do formato. Pode não funcionar para todos os arquivos MoTeC.
@@ -88,33 +372,68 @@ class MotecParser(BaseParser):
 
     FIRST_CHANNEL_OFFSET_GUESS = 0x2c68
 
+    # Canais usados como referência do total de amostras, em ordem de prioridade
+    REF_CHANNEL_PRIORITY = ("LAP_BEACON", "Distance", "Time")
+
     def parse(self, file_path: str) -> Optional[TelemetrySession]:
-        logger.info(f"Iniciando parsing MoTeC para: {file_path}")
+        logger.info("Iniciando parsing MoTeC para: %s", file_path)
 
         # Verifica arquivos LD/LDX
         if not os.path.exists(file_path):
-            logger.error(f"Arquivo não encontrado: {file_path}")
+            logger.error("Arquivo não encontrado: %s", file_path)
             return None
             
         if file_path.lower().endswith(".ldx"):
             ld_file_path = file_path[:-1]
             ldx_file_path = file_path
             if not os.path.exists(ld_file_path):
-                logger.error(f"Arquivo .ld correspondente não encontrado: {ld_file_path}")
+                logger.error("Arquivo .ld correspondente não encontrado: %s", ld_file_path)
                 return None
         elif file_path.lower().endswith(".ld"):
             ld_file_path = file_path
             ldx_file_path = file_path + "x"
             if not os.path.exists(ldx_file_path):
-                logger.warning(f"Arquivo .ldx correspondente não encontrado: {ldx_file_path}")
+                logger.warning("Arquivo .ldx correspondente não encontrado: %s", ldx_file_path)
                 ldx_file_path = None
         else:
             logger.error("Formato de arquivo inválido (deve ser .ld ou .ldx)")
             return None
 
+        # Arquivos inalterados desde o último parse reutilizam a sessão já montada
         try:
+            cache_key = (_file_signature(ld_file_path), _file_signature(ldx_file_path))
+        except OSError as e:
+            logger.error("Erro ao acessar arquivo MoTeC: %s", e)
+            return None
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            _PARSE_CACHE.move_to_end(cache_key)
+            logger.info("Sessão MoTeC reutilizada do cache: %s", file_path)
+            return _copy_session(cached)
+
+        telemetry_session = self._parse_files(file_path, ld_file_path, ldx_file_path)
+        if telemetry_session is None:
+            return None
+        # O cache guarda a sessão original; cada chamador recebe a sua cópia
+        _PARSE_CACHE[cache_key] = telemetry_session
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+        return _copy_session(telemetry_session)
+
+    def _parse_files(self, file_path: str, ld_file_path: str,
+                     ldx_file_path: Optional[str]) -> Optional[TelemetrySession]:
+        """Lê o par .ld/.ldx já validado e monta a TelemetrySession."""
+        ld_file = None
+        ld_mm = None
+        ld_mv = None
+        try:
+            # Mapeia o LD uma única vez; cabeçalho e canais leem da mesma memória
+            ld_file = open(ld_file_path, "rb")
+            ld_mm = mmap.mmap(ld_file.fileno(), 0, access=mmap.ACCESS_READ)
+            ld_mv = memoryview(ld_mm)
+
             # 1. Ler Cabeçalho do LD
-            ld_head = _ldHead(ld_file_path)
+            ld_head = _ldHead(ld_mv)
             
             # 2. Ler Metadados dos Canais do LD
             channels: Dict[str, _ldChan] = {}
@@ -124,34 +443,34 @@ class MotecParser(BaseParser):
 
             # Tenta ler o primeiro canal
             try:
-                first_chan = _ldChan(ld_file_path, meta_ptr)
+                first_chan = _ldChan(ld_mv, meta_ptr)
                 if first_chan.name and first_chan.np_dtype:
-                    logger.info(f"Primeiro canal encontrado: {first_chan.name} (Tipo: {first_chan.np_dtype})")
+                    logger.info("Primeiro canal encontrado: %s (Tipo: %s)", first_chan.name, first_chan.np_dtype)
                     channels[first_chan.name] = first_chan
                     processed_offsets.add(meta_ptr)
                     channel_count += 1
                     meta_ptr = first_chan.next_meta_ptr
                 else:
-                    logger.error(f"Não foi possível ler um canal válido no offset 0x{meta_ptr:08x}")
+                    logger.error("Não foi possível ler um canal válido no offset 0x%08x", meta_ptr)
                     return None
             except Exception as e:
-                logger.error(f"Erro ao tentar ler o primeiro canal: {e}")
+                logger.error("Erro ao tentar ler o primeiro canal: %s", e)
                 return None
 
             # Segue a lista encadeada
             while meta_ptr != 0 and meta_ptr not in processed_offsets:
                 processed_offsets.add(meta_ptr)
                 try:
-                    chan = _ldChan(ld_file_path, meta_ptr)
+                    chan = _ldChan(ld_mv, meta_ptr)
                     if chan.name and chan.np_dtype:
                         channels[chan.name] = chan
                         channel_count += 1
                         meta_ptr = chan.next_meta_ptr
                     else:
-                        logger.warning(f"Canal inválido em 0x{meta_ptr:08x}. Interrompendo lista.")
+                        logger.warning("Canal inválido em 0x%08x. Interrompendo lista.", meta_ptr)
                         break
                 except Exception as e:
-                    logger.error(f"Erro ao ler canal em 0x{meta_ptr:08x}: {e}")
+                    logger.error("Erro ao ler canal em 0x%08x: %s", meta_ptr, e)
                     break
                 if len(processed_offsets) > 1000:
                     logger.error("Limite de canais processados atingido (1000)")
@@ -160,7 +479,7 @@ class MotecParser(BaseParser):
             if not channels:
                 logger.error("Nenhum canal válido encontrado")
                 return None
-            logger.info(f"{channel_count} canais lidos do arquivo LD")
+            logger.info("%d canais lidos do arquivo LD", channel_count)
 
             # 3. Tentar Ler Informações de Voltas do LDX
             ldx_laps = None
@@ -188,12 +507,40 @@ class MotecParser(BaseParser):
             # 6. Processar Voltas (ou sessão inteira se não houver LDX)
             session_laps: List[LapData] = []
 
+            # Só interessam canais cujo nome padronizado vira um campo do DataPoint;
+            # os demais nem são lidos/convertidos
+            std_names: Dict[str, str] = {}
+            for chan_name in channels:
+                std_name = self.CHANNEL_MAP.get(chan_name, chan_name)
+                if std_name in _DP_FIELD_SET or std_name == "timestamp_s":
+                    std_names[chan_name] = std_name
+
+            # Lê e converte cada canal uma única vez. Canais com a mesma frequência e tamanho
+            # são gravados como linhas de uma única matriz float32 contígua, de modo que as
+            # fatias de uma volta ficam próximas na memória
+            groups: Dict[Tuple[int, int], List[str]] = {}
+            for chan_name in std_names:
+                chan = channels[chan_name]
+                if chan.data_len > 0:
+                    groups.setdefault((chan.freq, chan.data_len), []).append(chan_name)
+
+            decoded: Dict[str, np.ndarray] = {}
+            for (_, n_samples), names in groups.items():
+                matrix = np.empty((len(names), n_samples), dtype=np.float32)
+                for row, chan_name in enumerate(names):
+                    chan_data = channels[chan_name].get_data(out=matrix[row])
+                    if chan_data is not None:
+                        decoded[chan_name] = chan_data
+
+            # Indexa pelo nome padronizado, na ordem original dos canais;
+            # as voltas usam fatias (views) destes arrays
+            full_data: Dict[str, np.ndarray] = {}
+            for chan_name, std_name in std_names.items():
+                if chan_name in decoded:
+                    full_data[std_name] = decoded[chan_name]
+
             # Encontra canal de referência para tamanho dos dados
-            ref_chan = None
-            for ref_name in ["LAP_BEACON", "Distance", "Time"]:
-                if ref_name in channels:
-                    ref_chan = channels[ref_name]
-                    break
+            ref_chan = next((channels[n] for n in self.REF_CHANNEL_PRIORITY if n in channels), None)
             total_points = ref_chan.data_len if ref_chan else None
 
             if ldx_laps:
@@ -203,108 +550,29 @@ class MotecParser(BaseParser):
                     end_idx = ldx_lap.end_offset
                     
                     if total_points is None or start_idx < 0 or end_idx > total_points or start_idx >= end_idx:
-                        logger.error(f"Lap offsets inválidos: lap={ldx_lap.lap_num}, start={start_idx}, end={end_idx}")
+                        logger.error("Lap offsets inválidos: lap=%s, start=%s, end=%s", ldx_lap.lap_num, start_idx, end_idx)
                         continue
                     laps_validos.append(ldx_lap)
 
                 if laps_validos:
                     logger.info("Processando dados por volta usando LDX")
                     for ldx_lap in laps_validos:
-                        start_idx = ldx_lap.start_offset
-                        count = ldx_lap.end_offset - start_idx + 1
-                        lap_data_dict = {}
-                        
-                        for chan_name, chan in channels.items():
-                            chan_data = chan.get_data(start_idx, count)
-                            if chan_data is not None and len(chan_data) > 0:
-                                std_name = self.CHANNEL_MAP.get(chan_name, chan_name)
-                                lap_data_dict[std_name] = chan_data
-                        
-                        if not lap_data_dict:
-                            logger.warning(f"Nenhum dado válido para a volta {ldx_lap.lap_num}")
-                            continue
-                            
-                        min_samples = min(len(data) for data in lap_data_dict.values())
-                        data_points = []
-                        
-                        for i in range(min_samples):
-                            point_data = {}
-                            for key, values in lap_data_dict.items():
-                                point_data[key] = values[i] if i < len(values) else 0.0
-                            
-                            # Preenche campos obrigatórios
-                            point_data.setdefault('timestamp_ms', 0)
-                            point_data.setdefault('distance_m', 0.0)
-                            point_data.setdefault('speed_kmh', 0.0)
-                            point_data.setdefault('rpm', 0)
-                            point_data.setdefault('gear', 0)
-                            point_data.setdefault('throttle', 0.0)
-                            point_data.setdefault('brake', 0.0)
-                            point_data.setdefault('steer_angle', 0.0)
-                            point_data.setdefault('pos_x', 0.0)
-                            point_data.setdefault('pos_y', 0.0)
-                            point_data.setdefault('pos_z', 0.0)
-                            point_data.setdefault('clutch', 0.0)
-                            
-                            # Converte timestamp se necessário
-                            if 'timestamp_s' in point_data:
-                                point_data['timestamp_ms'] = int(point_data['timestamp_s'] * 1000)
-                                del point_data['timestamp_s']
-                            
-                            data_points.append(DataPoint(**point_data))
-                        
-                        lap_data = LapData(
-                            lap_number=ldx_lap.lap_num,
-                            lap_time_ms=int(ldx_lap.lap_time_s * 1000),
-                            is_valid=True,
-                            data_points=data_points
-                        )
-                        session_laps.append(lap_data)
+                        lap_data = self._process_lap(ldx_lap, full_data)
+                        if lap_data is not None:
+                            session_laps.append(lap_data)
 
             # Processar sessão inteira como uma volta se não houver LDX válido
             if not session_laps:
                 logger.info("Processando sessão inteira como uma única volta")
-                lap_data_dict = {}
-                
-                for chan_name, chan in channels.items():
-                    chan_data = chan.get_data()
-                    if chan_data is not None and len(chan_data) > 0:
-                        std_name = self.CHANNEL_MAP.get(chan_name, chan_name)
-                        lap_data_dict[std_name] = chan_data
-                
+                lap_data_dict = full_data
+
                 if not lap_data_dict:
                     logger.error("Nenhum dado válido encontrado na sessão")
                     return None
                     
                 min_samples = min(len(data) for data in lap_data_dict.values())
-                data_points = []
-                
-                for i in range(min_samples):
-                    point_data = {}
-                    for key, values in lap_data_dict.items():
-                        point_data[key] = values[i] if i < len(values) else 0.0
-                    
-                    # Preenche campos obrigatórios
-                    point_data.setdefault('timestamp_ms', 0)
-                    point_data.setdefault('distance_m', 0.0)
-                    point_data.setdefault('speed_kmh', 0.0)
-                    point_data.setdefault('rpm', 0)
-                    point_data.setdefault('gear', 0)
-                    point_data.setdefault('throttle', 0.0)
-                    point_data.setdefault('brake', 0.0)
-                    point_data.setdefault('steer_angle', 0.0)
-                    point_data.setdefault('pos_x', 0.0)
-                    point_data.setdefault('pos_y', 0.0)
-                    point_data.setdefault('pos_z', 0.0)
-                    point_data.setdefault('clutch', 0.0)
-                    
-                    # Converte timestamp se necessário
-                    if 'timestamp_s' in point_data:
-                        point_data['timestamp_ms'] = int(point_data['timestamp_s'] * 1000)
-                        del point_data['timestamp_s']
-                    
-                    data_points.append(DataPoint(**point_data))
-                
+                data_points = _pack_data_points(lap_data_dict, min_samples)
+
                 lap_data = LapData(
                     lap_number=1,
                     lap_time_ms=0,
@@ -324,13 +592,44 @@ class MotecParser(BaseParser):
                 laps=session_laps
             )
 
-            logger.info(f"Parsing MoTeC concluído: {len(session_laps)} voltas processadas")
+            logger.info("Parsing MoTeC concluído: %d voltas processadas", len(session_laps))
             return telemetry_session
 
         except Exception as e:
-            logger.exception(f"Erro fatal ao processar arquivo MoTeC: {e}")
+            logger.exception("Erro fatal ao processar arquivo MoTeC: %s", e)
+            return None
+        finally:
+            if ld_mv is not None:
+                ld_mv.release()
+            if ld_mm is not None:
+                ld_mm.close()
+            if ld_file is not None:
+                ld_file.close()
+
+    def _process_lap(self, ldx_lap: _ldxLapInfo, full_data: Dict[str, np.ndarray]) -> Optional[LapData]:
+        """Monta o LapData de uma volta do LDX a partir dos arrays completos (somente leitura)."""
+        start_idx = ldx_lap.start_offset
+        end_idx = ldx_lap.end_offset + 1
+        lap_data_dict = {
+            std_name: chan_data[start_idx:end_idx]
+            for std_name, chan_data in full_data.items()
+            if end_idx <= len(chan_data)
+        }
+
+        if not lap_data_dict:
+            logger.warning("Nenhum dado válido para a volta %s", ldx_lap.lap_num)
             return None
 
+        min_samples = min(len(data) for data in lap_data_dict.values())
+        data_points = _pack_data_points(lap_data_dict, min_samples)
+
+        return LapData(
+            lap_number=ldx_lap.lap_num,
+            lap_time_ms=int(ldx_lap.lap_time_s * 1000),
+            is_valid=True,
+            data_points=data_points
+        )
+
     def convert_ld_to_csv(self, ld_file_path: str, csv_file_path: str) -> bool:
         """
         Converte um arquivo .ld para .csv usando o próprio parser.
@@ -347,7 +646,7 @@ class MotecParser(BaseParser):
                 writer = None
                 for lap in session.laps:
                     for dp in lap.data_points:
-                        row = dp.__dict__ if hasattr(dp, "__dict__") else dict(dp)
+                        row = asdict(dp)
                         if writer is None:
                             writer = csv.DictWriter(csvfile, fieldnames=row.keys())
                             writer.writeheader()
@@ -376,8 +675,8 @@ class CSVParser(BaseParser):
             with open(file_path, "r", newline="") as csvfile:
                 reader = csv.DictReader(csvfile)
                 data_points = []
-                # Obtenha os campos válidos do DataPoint
-                valid_fields = set(DataPoint.__annotations__.keys())
+                # Campos válidos do DataPoint
+                valid_fields = _DP_FIELD_SET
                 for row in reader:
                     dp_data = {}
                     for k, v in row.items():
@@ -429,15 +728,19 @@ class CSVParser(BaseParser):
             return None
 
 # --- Factory para criar o parser apropriado ---
+# Extensões sem o ponto inicial, em minúsculas
+_PARSER_REGISTRY = {
+    "ld": MotecParser,
+    "ldx": MotecParser,
+    "ibt": IBTParser,
+    "csv": CSVParser,
+}
+
 def create_parser(file_path: str) -> Optional[BaseParser]:
-    file_ext = os.path.splitext(file_path)[1].lower()
-
-    if file_ext == ".ld" or file_ext == ".ldx":
-        return MotecParser()
-    elif file_ext == ".ibt":
-        return IBTParser()
-    elif file_ext == ".csv":
-        return CSVParser()
-    else:
-        logger.error(f"Formato não suportado: {file_ext}")
-        return None
\ No newline at end of file
+    file_ext = file_path.rpartition(".")[2].lower()
+
+    parser_cls = _PARSER_REGISTRY.get(file_ext)
+    if parser_cls is None:
+        logger.error("Formato não suportado: %s", file_ext)
+        return None
+    return parser_cls()
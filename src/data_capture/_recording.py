@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Gravação das voltas capturadas em tempo real, comum às capturas do ACC e do LMU/rF2.
+Os pontos de cada volta ficam em um array numpy com os campos de DataPoint; as voltas
+prontas são publicadas por troca de referência e serializadas como dicts sob demanda.
+"""
+
+import threading
+from dataclasses import fields
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+from src.core.standard_data import DataPoint
+
+# Registro com os mesmos campos (e ordem) de DataPoint: 160 bytes contíguos por ponto, em vez
+# de um objeto Python por pacote. Os floats ficam em <f8 para os dois jogos: o rF2 publica
+# doubles e os c_float do ACC cabem sem perda, então nenhum valor muda de um jogo para o outro.
+DP_FIELDS = tuple(f.name for f in fields(DataPoint))
+DP_DTYPE = np.dtype([
+    (f.name, "<i8" if f.name == "timestamp_ms" else "<i4" if f.type is int else "<f8")
+    for f in fields(DataPoint)
+])
+TYRE_TEMP_FIELDS = ("tyre_temp_fl", "tyre_temp_fr", "tyre_temp_rl", "tyre_temp_rr")
+TYRE_PRESS_FIELDS = ("tyre_press_fl", "tyre_press_fr", "tyre_press_rl", "tyre_press_rr")
+
+def records_to_dicts(records: np.ndarray) -> List[Dict[str, Any]]:
+    """Serializa os pontos (array com dtype DP_DTYPE) como dicts; tolist() converte em C."""
+    return [dict(zip(DP_FIELDS, values)) for values in records.tolist()]
+
+class LapRecorder:
+    """Buffer da volta em andamento e voltas publicadas de uma captura em tempo real.
+
+    A thread de captura é a única escritora: grava cada ponto em `_next_row()`, confirma com
+    `_commit_row()` e fecha a volta com `_close_lap()`. Os getters podem ser chamados de
+    qualquer thread.
+    """
+
+    # Capacidade inicial do buffer de pontos da volta atual (dobra se uma volta exceder)
+    LAP_BUFFER_SIZE = 8192
+
+    def __init__(self):
+        # Publicado por troca de referência: a thread de captura é a única escritora e nunca
+        # altera um dict/lista já publicado, então leitores não precisam de lock
+        self.telemetry_data = {"session": {}, "laps": []}
+        # Pontos de cada volta já serializados como dicts, por lap_number: (array de origem, dicts).
+        # Preenchido sob demanda por quem lê (fora da thread de captura), que pode ser mais de uma
+        # thread ao mesmo tempo; por isso o cache tem seu próprio lock
+        self._serialized_points: Dict[int, Tuple[np.ndarray, List[Dict[str, Any]]]] = {}
+        self._serialized_lock = threading.Lock()
+        # Buffer pré-alocado e reutilizado entre voltas; só os primeiros current_lap_count são válidos
+        self.current_lap_points = np.zeros(self.LAP_BUFFER_SIZE, dtype=DP_DTYPE)
+        self.current_lap_count = 0
+        # (buffer, linha) do último ponto gravado pela thread de captura, trocado por referência.
+        # A linha só é reescrita depois que a captura já avançou para pontos mais novos
+        self._latest_point: Optional[Tuple[np.ndarray, int]] = None
+
+    def get_telemetry_data(self):
+        # Voltas finalizadas não são mais alteradas pela captura: basta copiar os dicts
+        # de cada volta (os pontos são compartilhados), em vez de um deepcopy da sessão inteira
+        snapshot = self.telemetry_data # Leitura de uma única referência (atômica sob o GIL)
+        # A captura publica os pontos como array; a conversão para dicts acontece aqui, uma
+        # única vez por volta, e não na thread de captura ao fechar a volta
+        serialized_laps = []
+        with self._serialized_lock:
+            for lap in snapshot["laps"]:
+                records = lap["data_points"]
+                cached = self._serialized_points.get(lap["lap_number"])
+                # O array de origem confirma que a entrada é desta volta (e não de uma
+                # volta com o mesmo número de uma captura anterior)
+                if cached is None or cached[0] is not records:
+                    cached = (records, records_to_dicts(records))
+                    self._serialized_points[lap["lap_number"]] = cached
+                serialized_laps.append(dict(lap, data_points=cached[1]))
+        return {
+            "session": dict(snapshot["session"]),
+            "laps": serialized_laps,
+        }
+
+    def get_latest_datapoint(self) -> Optional[DataPoint]:
+        """Retorna o ponto mais recente capturado, sem bloquear nem ler a memória compartilhada."""
+        latest = self._latest_point
+        if latest is None:
+            return None
+        points, index = latest
+        return DataPoint(*points[index].tolist())
+
+    def get_current_lap_points(self) -> np.ndarray:
+        """Retorna uma cópia dos pontos já capturados da volta em andamento (sem lock).
+
+        Os pontos ficam em um array com dtype DP_DTYPE; a cópia é um único memcpy.
+        """
+        points = self.current_lap_points
+        return points[:self.current_lap_count].copy()
+
+    def _publish_session(self, session: Dict[str, Any]):
+        """Troca os dados da sessão mantendo as voltas já publicadas."""
+        self.telemetry_data = {"session": session, "laps": self.telemetry_data["laps"]}
+
+    def _next_row(self) -> Tuple[np.ndarray, int]:
+        """Buffer e linha onde o próximo ponto deve ser gravado."""
+        if self.current_lap_count == len(self.current_lap_points):
+            # Buffer cheio: dobra a capacidade (raro; o tamanho inicial cobre uma volta típica)
+            self.current_lap_points = np.concatenate(
+                (self.current_lap_points, np.zeros_like(self.current_lap_points)))
+        return self.current_lap_points, self.current_lap_count
+
+    def _commit_row(self, points: np.ndarray, index: int):
+        """Confirma o ponto gravado em `index` como o mais recente da volta atual."""
+        self.current_lap_count = index + 1
+        self._latest_point = (points, index)
+
+    def _close_lap(self, points: np.ndarray, index: int, lap_number: int,
+                   lap_time: float, sectors: List[Dict[str, Any]]) -> int:
+        """Publica as linhas [0, index) como a volta `lap_number`.
+
+        A linha `index` já pertence à próxima volta e passa a ser a primeira do buffer.
+        Retorna o novo índice desse ponto (0).
+        """
+        lap_record = {
+            "lap_number": lap_number,
+            "lap_time": lap_time,
+            "sectors": sectors,
+            "data_points": points[:index].copy() # Array DP_DTYPE; serializado em get_telemetry_data
+        }
+        published = self.telemetry_data
+        self.telemetry_data = {
+            "session": published["session"],
+            "laps": published["laps"] + [lap_record],
+        }
+        # Zera a contagem antes de reescrever a linha 0: uma cópia sem lock feita entre as duas
+        # etapas veria a volta encerrada com o 1º ponto da próxima no lugar do seu
+        self.current_lap_count = 0
+        points[0] = points[index]
+        return 0
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Leitura de campos selecionados de estruturas ctypes direto de um buffer (mmap ou instância),
+comum aos leitores de memória compartilhada do ACC e do LMU/rF2.
+"""
+
+import ctypes
+import struct
+from operator import itemgetter
+
+def compile_field_unpacker(cls, names):
+    """Gera um leitor que extrai só os campos `names` de uma `cls` que começa em `offset` no buffer.
+
+    O leitor tem a assinatura `read(buffer, offset=0)`; `buffer` é qualquer objeto com o
+    protocolo de buffer (mmap, bytes ou a própria instância ctypes). Os campos são lidos em
+    ordem de offset por um único struct.unpack_from (com bytes de preenchimento "x" entre eles)
+    e devolvidos como tupla na ordem pedida; um array contribui com todos os seus valores
+    soltos, em sequência. Só campos escalares ou arrays de escalares são suportados.
+    """
+    ctypes_by_name = dict(cls._fields_)
+    fmt = ["="]   # ordem de bytes nativa, sem alinhamento implícito (os offsets são explícitos)
+    slots = {}    # nome -> (posição na tupla desempacotada, quantidade de valores)
+    pos = 0
+    i = 0
+    for name in sorted(names, key=lambda n: getattr(cls, n).offset):
+        descriptor = getattr(cls, name)
+        ctype = ctypes_by_name[name]
+        if descriptor.offset > pos:
+            fmt.append(f"{descriptor.offset - pos}x")
+        if issubclass(ctype, ctypes.Array):
+            count = ctype._length_
+            fmt.append(f"{count}{ctype._type_._type_}")
+        else:
+            count = 1
+            fmt.append(ctype._type_)
+        slots[name] = (i, count)
+        i += count
+        pos = descriptor.offset + descriptor.size
+    unpack_from = struct.Struct("".join(fmt)).unpack_from
+    indices = [k for name in names for k in range(slots[name][0], sum(slots[name]))]
+    if len(indices) == 1:
+        # itemgetter com um único índice devolveria o valor solto, não uma tupla
+        index = indices[0]
+        return lambda buffer, offset=0: (unpack_from(buffer, offset)[index],)
+    reorder = itemgetter(*indices)
+    return lambda buffer, offset=0: reorder(unpack_from(buffer, offset))
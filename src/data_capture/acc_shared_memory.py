@@ -11,17 +11,20 @@ import logging
 import ctypes
 from ctypes import Structure, c_float, c_int, c_wchar, c_double, c_char, sizeof, byref
 import mmap
+import struct
+import numpy as np
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 import json
 import threading # Adicionado para locking
-import copy      # Adicionado para deepcopy
 
 # Adiciona o diretório pai ao path para permitir imports absolutos
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 
 # Importa a estrutura de dados padronizada
 from src.core.standard_data import TelemetrySession, SessionInfo, TrackData, LapData, DataPoint
+from src.data_capture._struct_fields import compile_field_unpacker
+from src.data_capture._recording import TYRE_TEMP_FIELDS, TYRE_PRESS_FIELDS, LapRecorder
 
 # Configuração de logging
 logger = logging.getLogger(__name__) # Usa o nome do módulo
@@ -111,7 +114,14 @@ class SPageFileStatic(Structure):
         ("dryTyresName", c_wchar * 33), ("wetTyresName", c_wchar * 33)
     ]
 
-# --- Helper para conversão de ctypes para JSON (sem alterações) ---
+# Tamanhos das páginas, calculados uma vez (usados no mmap e no plano de cópia)
+_PHYSICS_SIZE = sizeof(SPageFilePhysics)
+_GRAPHICS_SIZE = sizeof(SPageFileGraphic)
+_STATIC_SIZE = sizeof(SPageFileStatic)
+
+# --- Helper para conversão de ctypes para JSON ---
+_SCALAR_CTYPES = (c_float, c_int, c_double)
+
 def convert_ctypes_to_native(data):
     if isinstance(data, (int, float, str, bool)) or data is None:
         return data
@@ -121,8 +131,15 @@ def convert_ctypes_to_native(data):
         except UnicodeDecodeError:
             return repr(data)
     elif isinstance(data, ctypes.Array):
+        if data._type_ in _SCALAR_CTYPES:
+            # Arrays de escalares: o fatiamento do ctypes já devolve uma lista nativa (em C)
+            return data[:]
         return [convert_ctypes_to_native(item) for item in data]
     elif isinstance(data, Structure):
+        reader = struct_reader(type(data))
+        if reader is not None:
+            # Conversor pré-compilado por classe: um unpack_from em vez de getattr campo a campo
+            return reader(data)
         result = {}
         for field_name, field_type in data._fields_:
             result[field_name] = convert_ctypes_to_native(getattr(data, field_name))
@@ -136,6 +153,101 @@ def convert_ctypes_to_native(data):
     else:
         return repr(data)
 
+# --- Conversão via dtype estruturado do numpy ---
+# A página de física só tem campos numéricos, então o numpy consegue descrevê-la como
+# um registro estruturado com o mesmo layout do ctypes. Páginas com c_wchar (gráficos,
+# estáticos) não têm dtype equivalente e usam o struct.Struct pré-compilado abaixo.
+_PHYSICS_DTYPE = np.dtype(SPageFilePhysics)
+
+def record_to_native(record: np.ndarray) -> Dict[str, Any]:
+    """Converte um registro numpy estruturado (array de 1 elemento) em dict nativo."""
+    values = record.tolist()[0]
+    return {name: (value.tolist() if isinstance(value, np.ndarray) else value)
+            for name, value in zip(record.dtype.names, values)}
+
+# --- Conversão via struct.Struct pré-compilado ---
+# Para páginas com strings (c_wchar), o formato do struct é derivado dos _fields_ uma
+# única vez; cada leitura é um único unpack_from sobre a estrutura, reagrupado por campo.
+_WCHAR_CODEC = "utf-16-le" if sizeof(c_wchar) == 2 else "utf-32-le"
+
+def compile_struct_reader(cls):
+    """Gera uma função que converte instâncias de `cls` em dict nativo via struct.unpack_from.
+
+    O corpo da função é gerado (exec) uma única vez a partir dos _fields_: cada campo vira
+    uma expressão direta sobre a tupla desempacotada, sem despacho por tipo em tempo de execução.
+    """
+    fmt = ["@"]  # alinhamento nativo, igual ao do ctypes
+    items = []   # expressões "nome: valor" do dict gerado
+    i = 0        # posição do campo na tupla desempacotada
+    for name, ctype in cls._fields_:
+        shape = []
+        base = ctype
+        while issubclass(base, ctypes.Array):
+            shape.append(base._length_)
+            base = base._type_
+        if not issubclass(base, ctypes._SimpleCData):
+            raise TypeError(f"Campo {name!r} de {cls.__name__} não é escalar ({base.__name__})")
+        if base is c_wchar:
+            fmt.append(f"{shape[0] * sizeof(c_wchar)}s")
+            items.append(f"{name!r}: v[{i}].decode({_WCHAR_CODEC!r}).partition('\\x00')[0]")
+            i += 1
+        elif not shape:
+            fmt.append(base._type_)
+            items.append(f"{name!r}: v[{i}]")
+            i += 1
+        elif len(shape) == 1:
+            fmt.append(f"{shape[0]}{base._type_}")
+            items.append(f"{name!r}: list(v[{i}:{i + shape[0]}])")
+            i += shape[0]
+        else:
+            rows, cols = shape
+            fmt.append(f"{rows * cols}{base._type_}")
+            row_exprs = ", ".join(f"list(v[{i + r * cols}:{i + (r + 1) * cols}])" for r in range(rows))
+            items.append(f"{name!r}: [{row_exprs}]")
+            i += rows * cols
+    layout = struct.Struct("".join(fmt))
+    if layout.size != sizeof(cls):
+        raise TypeError(f"Layout struct de {cls.__name__} difere do ctypes ({layout.size} != {sizeof(cls)})")
+
+    src = "def read(data):\n    v = unpack_from(data)\n    return {" + ", ".join(items) + "}\n"
+    namespace: Dict[str, Any] = {"unpack_from": layout.unpack_from}
+    exec(src, namespace)
+    return namespace["read"]
+
+# Campos do caminho rápido (read_into/read_datapoint), na ordem de DataPoint
+_PHYSICS_FAST = compile_field_unpacker(SPageFilePhysics, (
+    "speedKmh", "rpms", "gear", "steerAngle", "gas", "brake", "clutch",
+    "tyreCoreTemperature", "wheelsPressure",
+))
+_GRAPHICS_FAST = compile_field_unpacker(SPageFileGraphic, (
+    "distanceTraveled", "iCurrentTime", "currentSectorIndex", "playerCarID",
+))
+
+_STRUCT_READERS: Dict[type, Any] = {}
+
+def struct_reader(cls):
+    """Retorna o conversor compilado de `cls` (em cache), ou None se o layout não for suportado."""
+    try:
+        return _STRUCT_READERS[cls]
+    except KeyError:
+        pass
+    try:
+        reader = compile_struct_reader(cls)
+    except TypeError as e:
+        # Ex.: estruturas aninhadas; convert_ctypes_to_native cai no caminho recursivo
+        logger.debug("Sem conversor compilado para %s: %s", cls.__name__, e)
+        reader = None
+    _STRUCT_READERS[cls] = reader
+    return reader
+
+_read_graphics_native = struct_reader(SPageFileGraphic)
+
+# carCoordinates é float[60][3] no C: as coordenadas de cada carro são 3 floats contíguos
+_MAX_CARS = 60
+_VEC3 = c_float * 3
+_CAR_COORDS_OFFSET = SPageFileGraphic.carCoordinates.offset
+_ORIGIN = (0.0, 0.0, 0.0)
+
 class ACCSharedMemoryReader:
     """Classe para ler dados da memória compartilhada do Assetto Corsa."""
 
@@ -145,9 +257,26 @@ class ACCSharedMemoryReader:
         self.graphics_mmap = None
         self.static_mmap = None
 
+        # Estruturas mapeadas diretamente sobre a memória compartilhada (from_buffer, sem cópia)
+        self._physics_view = None
+        self._graphics_view = None
+        self._static_view = None
+        self._copy_plan: Dict[str, Any] = {}
+        # Registro numpy "ao vivo" sobre o mmap de física (sem cópia; pode mudar entre dois acessos)
+        self.physics_live: Optional[np.ndarray] = None
+
         self.physics_data = SPageFilePhysics()
+        # Mesma memória de physics_data vista como registro numpy (um layout, duas APIs):
+        # physics_data.speedKmh == physics_record["speedKmh"][0]
+        self.physics_record = np.frombuffer(self.physics_data, dtype=_PHYSICS_DTYPE, count=1)
         self.graphics_data = SPageFileGraphic()
         self.static_data = SPageFileStatic()
+        # Views (x, y, z) de cada carro sobre graphics_data, criadas uma única vez: as estruturas
+        # de snapshot são reaproveitadas via memmove, então nada é alocado por pacote
+        coords_addr = ctypes.addressof(self.graphics_data) + _CAR_COORDS_OFFSET
+        self._car_positions = [_VEC3.from_address(coords_addr + i * sizeof(_VEC3)) for i in range(_MAX_CARS)]
+        # Cópia nativa dos dados estáticos (não mudam durante a sessão; convertidos uma vez)
+        self.static_native: Optional[Dict[str, Any]] = None
 
         self.is_connected = False
         self.last_physics_packet_id = -1
@@ -161,19 +290,34 @@ class ACCSharedMemoryReader:
             logger.warning("Já está conectado.")
             return True
         try:
-            self.physics_mmap = mmap.mmap(-1, sizeof(SPageFilePhysics), "Local\\acpmf_physics")
-            self.graphics_mmap = mmap.mmap(-1, sizeof(SPageFileGraphic), "Local\\acpmf_graphics")
-            self.static_mmap = mmap.mmap(-1, sizeof(SPageFileStatic), "Local\\acpmf_static")
+            self.physics_mmap = mmap.mmap(-1, _PHYSICS_SIZE, "Local\\acpmf_physics")
+            self.graphics_mmap = mmap.mmap(-1, _GRAPHICS_SIZE, "Local\\acpmf_graphics")
+            self.static_mmap = mmap.mmap(-1, _STATIC_SIZE, "Local\\acpmf_static")
+
+            # Vincula as estruturas ao mmap uma única vez; as leituras passam a ser só memmove
+            self._physics_view = SPageFilePhysics.from_buffer(self.physics_mmap)
+            self._graphics_view = SPageFileGraphic.from_buffer(self.graphics_mmap)
+            self._static_view = SPageFileStatic.from_buffer(self.static_mmap)
+            self.physics_live = np.frombuffer(self.physics_mmap, dtype=_PHYSICS_DTYPE, count=1)
+            # Endereços de origem (mmap) e destino (estruturas locais) resolvidos uma vez por conexão
+            self._copy_plan = {
+                "physics": (ctypes.addressof(self.physics_data), ctypes.addressof(self._physics_view), _PHYSICS_SIZE),
+                "graphics": (ctypes.addressof(self.graphics_data), ctypes.addressof(self._graphics_view), _GRAPHICS_SIZE),
+                "static": (ctypes.addressof(self.static_data), ctypes.addressof(self._static_view), _STATIC_SIZE),
+            }
 
             # Lê dados estáticos para confirmar conexão
             self._read_static_data()
-            if not self.static_data or not self.static_data.track or not self.static_data.carModel:
+            # Strings c_wchar decodificadas uma única vez; depois disso só o dict é consultado
+            static = convert_ctypes_to_native(self.static_data)
+            if not static["track"] or not static["carModel"]:
                 logger.error("Dados estáticos inválidos ou ACC não está em uma sessão ativa.")
                 self._cleanup_memory()
                 return False
 
+            self.static_native = static
             self.is_connected = True
-            logger.info(f"Conectado à memória compartilhada do ACC (Track: {self.static_data.track}, Car: {self.static_data.carModel})")
+            logger.info(f"Conectado à memória compartilhada do ACC (Track: {static['track']}, Car: {static['carModel']})")
             return True
 
         except FileNotFoundError:
@@ -188,50 +332,57 @@ class ACCSharedMemoryReader:
     def disconnect(self) -> bool:
         logger.info("Tentando desconectar da memória compartilhada do ACC")
         self._cleanup_memory()
+        self.static_native = None
         self.is_connected = False
         logger.info("Desconectado da memória compartilhada do ACC")
         return True
 
     def _cleanup_memory(self):
         """Fecha os mapeamentos de memória."""
-        if self.physics_mmap:
+        # As views exportam o buffer do mmap; precisam ser liberadas antes do close()
+        self._physics_view = None
+        self._graphics_view = None
+        self._static_view = None
+        self.physics_live = None
+        self._copy_plan = {}
+        if self.physics_mmap is not None:
             self.physics_mmap.close()
             self.physics_mmap = None
-        if self.graphics_mmap:
+        if self.graphics_mmap is not None:
             self.graphics_mmap.close()
             self.graphics_mmap = None
-        if self.static_mmap:
+        if self.static_mmap is not None:
             self.static_mmap.close()
             self.static_mmap = None
 
     def _read_physics_data(self):
         """Lê os dados de física da memória compartilhada."""
-        if not self.physics_mmap:
+        if self._physics_view is None:
             return
         try:
-            self.physics_mmap.seek(0)
-            ctypes.memmove(byref(self.physics_data), self.physics_mmap.read(sizeof(SPageFilePhysics)), sizeof(SPageFilePhysics))
+            # Cópia instantânea da memória mapeada para a estrutura local (um único memcpy)
+            ctypes.memmove(*self._copy_plan["physics"])
         except Exception as e:
             logger.error(f"Erro ao ler dados de física: {e}")
             # Considerar desconectar ou tentar reconectar se erros persistirem
 
     def _read_graphics_data(self):
         """Lê os dados gráficos da memória compartilhada."""
-        if not self.graphics_mmap:
+        if self._graphics_view is None:
             return
         try:
-            self.graphics_mmap.seek(0)
-            ctypes.memmove(byref(self.graphics_data), self.graphics_mmap.read(sizeof(SPageFileGraphic)), sizeof(SPageFileGraphic))
+            # Cópia instantânea da memória mapeada para a estrutura local (um único memcpy)
+            ctypes.memmove(*self._copy_plan["graphics"])
         except Exception as e:
             logger.error(f"Erro ao ler dados gráficos: {e}")
 
     def _read_static_data(self):
         """Lê os dados estáticos da memória compartilhada."""
-        if not self.static_mmap:
+        if self._static_view is None:
             return
         try:
-            self.static_mmap.seek(0)
-            ctypes.memmove(byref(self.static_data), self.static_mmap.read(sizeof(SPageFileStatic)), sizeof(SPageFileStatic))
+            # Cópia instantânea da memória mapeada para a estrutura local (um único memcpy)
+            ctypes.memmove(*self._copy_plan["static"])
         except Exception as e:
             logger.error(f"Erro ao ler dados estáticos: {e}")
 
@@ -241,26 +392,70 @@ class ACCSharedMemoryReader:
             logger.warning("Tentativa de ler dados sem estar conectado.")
             return None
 
+        if not self._refresh_snapshot():
+            return None # Nenhum dado novo
+
+        # Retorna uma cópia dos dados lidos em formato nativo Python
+        return {
+            "physics": record_to_native(self.physics_record),
+            "graphics": _read_graphics_native(self.graphics_data),
+            "static": self.static_native # Dados estáticos não mudam; convertidos uma única vez no connect
+        }
+
+    def _refresh_snapshot(self) -> bool:
+        """Atualiza physics_data/graphics_data se houver pacote novo. Retorna True se atualizou.
+
+        O ACC reescreve as páginas a ~333 Hz; a cópia para o snapshot garante que todos os campos
+        de um DataPoint venham do mesmo pacote. Para leituras pontuais use physics_live.
+        """
+        # Verifica se há dados novos lendo só o packetId direto da memória mapeada (4 bytes);
+        # as páginas completas só são copiadas quando algum pacote mudou
+        current_physics_id = self._physics_view.packetId
+        current_graphics_id = self._graphics_view.packetId
+
+        if current_physics_id == self.last_physics_packet_id and current_graphics_id == self.last_graphics_packet_id:
+            return False
+
+        self.last_physics_packet_id = current_physics_id
+        self.last_graphics_packet_id = current_graphics_id
         self._read_physics_data()
         self._read_graphics_data()
+        return True
 
-        # Verifica se há dados novos (baseado no packetId da física, que atualiza mais rápido)
-        current_physics_id = self.physics_data.packetId
-        current_graphics_id = self.graphics_data.packetId
+    def _snapshot_values(self) -> tuple:
+        """Valores do snapshot atual na ordem dos campos de DataPoint (e de DP_DTYPE)."""
+        # Um unpack_from por página lê só os bytes usados, sem despacho de atributos do ctypes
+        distance, lap_time, sector, player = _GRAPHICS_FAST(self.graphics_data)
+        pos = self._car_positions[player] if 0 <= player < _MAX_CARS else _ORIGIN
+        return (
+            time.monotonic_ns() // 1_000_000, # Relógio monotônico (imune a ajustes do relógio do sistema)
+            distance,
+            lap_time,
+            sector,
+            *pos,
+            # speedKmh, rpms, gear, steerAngle, gas, brake, clutch, pneus FL/FR/RL/RR (temp., pressão)
+            *_PHYSICS_FAST(self.physics_data),
+        )
+
+    def read_datapoint(self) -> Optional[DataPoint]:
+        """Caminho rápido: monta o DataPoint direto das estruturas lidas.
+
+        Equivalente a normalize_to_datapoint(read_data()), mas sem converter as páginas
+        inteiras para dicts a cada pacote. Os demais campos continuam em physics_data/graphics_data.
+        """
+        if not self.is_connected or not self._refresh_snapshot():
+            return None
+        return DataPoint(*self._snapshot_values())
 
-        if current_physics_id != self.last_physics_packet_id or current_graphics_id != self.last_graphics_packet_id:
-            self.last_physics_packet_id = current_physics_id
-            self.last_graphics_packet_id = current_graphics_id
+    def read_into(self, buffer: np.ndarray, index: int) -> bool:
+        """Grava o pacote novo (se houver) na linha `index` de um array com dtype DP_DTYPE.
 
-            # Retorna uma cópia dos dados lidos em formato nativo Python
-            return {
-                "physics": convert_ctypes_to_native(self.physics_data),
-                "graphics": convert_ctypes_to_native(self.graphics_data),
-                "static": convert_ctypes_to_native(self.static_data) # Dados estáticos não mudam, mas incluímos por consistência
-            }
-        else:
-            # logger.debug("Nenhum pacote novo de física ou gráficos.")
-            return None # Nenhum dado novo
+        Usado pela captura: nenhum objeto DataPoint é criado por pacote.
+        """
+        if not self.is_connected or not self._refresh_snapshot():
+            return False
+        buffer[index] = self._snapshot_values()
+        return True
 
     def normalize_to_datapoint(self, raw_data: Dict[str, Any]) -> Optional[DataPoint]:
         """Converte os dados brutos lidos em um objeto DataPoint padronizado."""
@@ -274,21 +469,30 @@ class ACCSharedMemoryReader:
              return None
 
         try:
+            # carCoordinates chega como 3 linhas de 60 floats (layout do ctypes), mas a memória é
+            # float[60][3]: o carro do jogador ocupa as posições planas player*3 .. player*3+2
+            coords = graphics.get("carCoordinates")
+            player = graphics.get("playerCarID", -1)
+            if coords and 0 <= player < _MAX_CARS:
+                pos_x, pos_y, pos_z = (coords[i // _MAX_CARS][i % _MAX_CARS] for i in range(player * 3, player * 3 + 3))
+            else:
+                pos_x = pos_y = pos_z = 0.0
+
+            # Pneus na ordem do ACC: FL, FR, RL, RR
+            tyres = dict(zip(TYRE_TEMP_FIELDS, physics.get("tyreCoreTemperature", ())))
+            tyres.update(zip(TYRE_PRESS_FIELDS, physics.get("wheelsPressure", ())))
+
             # Mapeamento dos campos ACC para DataPoint
             # Atenção: Alguns campos podem precisar de conversão ou cálculo
             datapoint = DataPoint(
-                timestamp_ms=int(time.time() * 1000), # Usa timestamp do sistema
+                timestamp_ms=time.monotonic_ns() // 1_000_000, # Relógio monotônico (imune a ajustes do relógio do sistema)
                 distance_m=graphics.get("distanceTraveled", 0.0),
                 lap_time_ms=graphics.get("iCurrentTime", 0),
                 sector=graphics.get("currentSectorIndex", 0),
-                # Posição: ACC fornece coordenadas normalizadas e globais. Usar globais?
-                # Precisa verificar se carCoordinates[playerCarID] está correto
-                # pos_x=graphics["carCoordinates"][graphics["playerCarID"]][0] if graphics["playerCarID"] < len(graphics["carCoordinates"]) else 0.0,
-                # pos_y=graphics["carCoordinates"][graphics["playerCarID"]][1] if graphics["playerCarID"] < len(graphics["carCoordinates"]) else 0.0,
-                # pos_z=graphics["carCoordinates"][graphics["playerCarID"]][2] if graphics["playerCarID"] < len(graphics["carCoordinates"]) else 0.0,
-                pos_x=0.0, # Placeholder - Coordenadas precisam de tratamento cuidadoso
-                pos_y=0.0, # Placeholder
-                pos_z=0.0, # Placeholder
+                # Posição: coordenadas globais do carro do jogador (índice playerCarID)
+                pos_x=pos_x,
+                pos_y=pos_y,
+                pos_z=pos_z,
                 speed_kmh=physics.get("speedKmh", 0.0),
                 rpm=physics.get("rpms", 0),
                 gear=physics.get("gear", 0),
@@ -297,9 +501,8 @@ class ACCSharedMemoryReader:
                 brake=physics.get("brake", 0.0),
                 clutch=physics.get("clutch", 0.0),
                 # Dados de pneus (exemplo - pegar FL)
-                tyre_temp_fl=physics["tyreCoreTemperature"][0] if len(physics.get("tyreCoreTemperature", [])) > 0 else None,
-                tyre_press_fl=physics["wheelsPressure"][0] if len(physics.get("wheelsPressure", [])) > 0 else None,
-                # ... adicionar outros pneus e canais conforme necessário
+                # ... adicionar outros canais conforme necessário
+                **tyres,
             )
             return datapoint
         except KeyError as e:
@@ -309,29 +512,51 @@ class ACCSharedMemoryReader:
             logger.exception(f"Erro ao normalizar dados ACC para DataPoint: {e}")
             return None
 
-class ACCTelemetryCapture:
+def lap_sector_times(records: np.ndarray, lap_time_ms: int) -> List[Dict[str, Any]]:
+    """Calcula os tempos de setor (s) de uma volta, de forma vetorizada sobre os pontos.
+
+    Cada setor começa no primeiro ponto com o novo índice de setor; o último termina no
+    tempo oficial da volta.
+    """
+    if not len(records):
+        return []
+    sectors = records["sector"]
+    times = records["lap_time_ms"].astype(np.int64)
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(sectors)) + 1))
+    start_times = times[starts]
+    start_times[0] = 0
+    durations = np.append(start_times[1:], lap_time_ms) - start_times
+
+    # Índice de setor do ACC começa em 0
+    return [{"sector": sector + 1, "time": duration / 1000.0}
+            for sector, duration in zip(sectors[starts].tolist(), durations.tolist())]
+
+class ACCTelemetryCapture(LapRecorder):
     """Captura de telemetria em tempo real do Assetto Corsa via memória compartilhada."""
 
+    # Espera entre consultas ao packetId quando não há pacote novo (s).
+    # 2 ms limitam o laço ocioso a ~500 despertares/s e atrasam um pacote novo em no máximo isso
+    IDLE_WAIT_S = 0.002
+
     def __init__(self):
+        super().__init__()
         self.reader = ACCSharedMemoryReader()
         self.is_connected = False
         self.is_capturing = False
         self.capture_thread = None
         self.stop_event = threading.Event()
-        self.data_lock = threading.Lock()
-        self.telemetry_data = {"session": {}, "laps": []}
-        self.current_lap_points = []
         self.last_lap = 0
 
     def connect(self) -> bool:
         self.is_connected = self.reader.connect()
         if self.is_connected:
-            static = self.reader.static_data
-            self.telemetry_data["session"] = {
-                "track": getattr(static, "track", ""),
-                "car": getattr(static, "carModel", ""),
-                "player": getattr(static, "playerName", ""),
-            }
+            static = self.reader.static_native
+            self._publish_session({
+                "track": static["track"],
+                "car": static["carModel"],
+                "player": static["playerName"],
+            })
         return self.is_connected
 
     def disconnect(self) -> bool:
@@ -358,29 +583,24 @@ class ACCTelemetryCapture:
         self.is_capturing = False
         return True
 
-    def get_telemetry_data(self):
-        with self.data_lock:
-            return copy.deepcopy(self.telemetry_data)
-
     def _capture_loop(self):
+        graphics = self.reader.graphics_data
         while not self.stop_event.is_set():
-            raw = self.reader.read_data()
-            if raw:
-                dp = self.reader.normalize_to_datapoint(raw)
-                if dp:
-                    with self.data_lock:
-                        lap = raw["graphics"].get("completedLaps", 0)
-                        if lap != self.last_lap and self.current_lap_points:
-                            self.telemetry_data["laps"].append({
-                                "lap_number": self.last_lap,
-                                "lap_time": raw["graphics"].get("iLastTime", 0) / 1000.0,
-                                "sectors": [],
-                                "data_points": [p.__dict__ for p in self.current_lap_points]
-                            })
-                            self.current_lap_points = []
-                        self.current_lap_points.append(dp)
-                        self.last_lap = lap
-            time.sleep(0.05)
+            # Grava o pacote direto na próxima linha do buffer (sem converter as páginas para dicts).
+            # read_into só copia as páginas quando o packetId mudou; consultar o packetId
+            # é uma leitura de 4 bytes do mmap, então o laço acompanha cada pacote do jogo
+            points, index = self._next_row()
+            if not self.reader.read_into(points, index):
+                self.stop_event.wait(self.IDLE_WAIT_S) # Sem pacote novo: cede a CPU (acorda na hora se parar)
+                continue
+            lap = graphics.completedLaps
+            if lap != self.last_lap and index:
+                # O pacote novo (já gravado em index) abre a próxima volta
+                lap_time_ms = graphics.iLastTime
+                index = self._close_lap(points, index, self.last_lap, lap_time_ms / 1000.0,
+                                        lap_sector_times(points[:index], lap_time_ms))
+            self._commit_row(points, index)
+            self.last_lap = lap
 
 # --- Exemplo de Uso (para teste direto do módulo) ---
 if __name__ == "__main__":
@@ -389,8 +609,8 @@ if __name__ == "__main__":
 
     if reader.connect():
         print("Conectado com sucesso!")
-        print(f"Track: {reader.static_data.track}")
-        print(f"Car: {reader.static_data.carModel}")
+        print(f"Track: {reader.static_native['track']}")
+        print(f"Car: {reader.static_native['carModel']}")
         print("Lendo dados por 10 segundos...")
 
         start_time = time.time()
@@ -27,6 +27,11 @@ handler.setFormatter(formatter)
 if not logger.hasHandlers():
     logger.addHandler(handler)
 
+# Layouts binários do arquivo LD (pré-compilados)
+_LD_HEADER = struct.Struct("<IIfI")        # version num_channels sample_rate num_samples
+_LD_LENGTH = struct.Struct("<I")           # tamanho de nome/unidade do canal
+_LD_CHANNEL_TAIL = struct.Struct("<Iff")   # data_type scale offset
+
 
 class LDParser:
     """Parser para arquivos binários LD do MoTeC."""
@@ -45,61 +50,52 @@ class LDParser:
     def parse(self) -> Dict[str, Any]:
         """Analisa o arquivo LD e retorna dados processados."""
         try:
+            # Lê o arquivo uma única vez; os campos são extraídos por offset do memoryview
             with open(self.file_path, "rb") as f:
-                self._parse_header(f)
-                self._parse_channels(f)
-                self._parse_data(f)
-                self._process_data()
-                # Retorna apenas os dados processados relevantes (laps, etc.)
-                return self.data 
+                data = memoryview(f.read())
+            self._parse_header(data)
+            data_start_pos = self._parse_channels(data)
+            self._parse_data(data, data_start_pos)
+            self._process_data()
+            # Retorna apenas os dados processados relevantes (laps, etc.)
+            return self.data
         except Exception as e:
             logger.error(f"Erro ao analisar arquivo LD {self.file_path}: {str(e)}")
             raise
     
-    def _parse_header(self, f):
-        f.seek(0)
-        signature = f.read(8)
+    def _parse_header(self, data: memoryview):
+        signature = bytes(data[0:8])
         if signature != b"LDFILE\x00\x00":
             raise ValueError(f"Assinatura inválida: {signature}")
-        self.header["version"] = struct.unpack("<I", f.read(4))[0]
-        self.header["num_channels"] = struct.unpack("<I", f.read(4))[0]
-        self.header["sample_rate"] = struct.unpack("<f", f.read(4))[0]
-        self.header["num_samples"] = struct.unpack("<I", f.read(4))[0]
+        (self.header["version"], self.header["num_channels"],
+         self.header["sample_rate"], self.header["num_samples"]) = _LD_HEADER.unpack_from(data, 8)
         logger.info(f"Cabeçalho LD: v={self.header['version']}, ch={self.header['num_channels']}, rate={self.header['sample_rate']}Hz, samples={self.header['num_samples']}")
 
-    def _parse_channels(self, f):
-        f.seek(24)
+    def _parse_channels(self, data: memoryview) -> int:
+        """Lê as definições de canal e retorna o offset onde começam os dados."""
+        offset = 24 # Posição após cabeçalho
         for i in range(self.header["num_channels"]):
-            name_len = struct.unpack("<I", f.read(4))[0]
-            name = f.read(name_len).decode("utf-8", errors="ignore")
-            unit_len = struct.unpack("<I", f.read(4))[0]
-            unit = f.read(unit_len).decode("utf-8", errors="ignore")
-            data_type = struct.unpack("<I", f.read(4))[0]
-            scale = struct.unpack("<f", f.read(4))[0]
-            offset = struct.unpack("<f", f.read(4))[0]
-            self.channels[i] = {"name": name, "unit": unit, "data_type": data_type, "scale": scale, "offset": offset}
+            name_len = _LD_LENGTH.unpack_from(data, offset)[0]
+            offset += 4
+            name = str(data[offset:offset + name_len], "utf-8", "ignore")
+            offset += name_len
+            unit_len = _LD_LENGTH.unpack_from(data, offset)[0]
+            offset += 4
+            unit = str(data[offset:offset + unit_len], "utf-8", "ignore")
+            offset += unit_len
+            data_type, scale, ch_offset = _LD_CHANNEL_TAIL.unpack_from(data, offset)
+            offset += _LD_CHANNEL_TAIL.size
+            self.channels[i] = {"name": name, "unit": unit, "data_type": data_type, "scale": scale, "offset": ch_offset}
             # logger.debug(f"Canal {i}: {name} ({unit})")
+        return offset
 
-    def _parse_data(self, f):
+    def _parse_data(self, data: memoryview, data_start_pos: int):
         # Calcula o tamanho esperado dos dados
         bytes_per_sample = 4 # Assumindo float32
         expected_data_size = self.header["num_samples"] * self.header["num_channels"] * bytes_per_sample
         
-        # Calcula a posição inicial dos dados
-        # Tamanho do cabeçalho + tamanho total das definições de canal
-        f.seek(24) # Posição após cabeçalho
-        channel_def_size = 0
-        for i in range(self.header["num_channels"]):
-             # name_len(4) + name + unit_len(4) + unit + type(4) + scale(4) + offset(4)
-             name_len = len(self.channels[i]["name"].encode("utf-8"))
-             unit_len = len(self.channels[i]["unit"].encode("utf-8"))
-             channel_def_size += 4 + name_len + 4 + unit_len + 4 + 4 + 4
-             
-        data_start_pos = 24 + channel_def_size
-        f.seek(data_start_pos)
-        
-        # Lê os dados brutos
-        raw_data = f.read(expected_data_size)
+        # Fatia os dados brutos (sem cópia)
+        raw_data = data[data_start_pos:data_start_pos + expected_data_size]
         if len(raw_data) != expected_data_size:
              logger.warning(f"Tamanho dos dados lidos ({len(raw_data)}) diferente do esperado ({expected_data_size}) para {self.file_path}")
              # Tenta ajustar o número de amostras se possível
@@ -177,34 +173,36 @@ class LDParser:
             if current_lap_number <= 0:
                 continue
 
-            # Extrai dados para a volta atual
-            lap_slice_indices = np.arange(start_idx, end_idx)
-            if len(lap_slice_indices) == 0:
+            # Extrai dados para a volta atual (fatia contígua, sem array de índices)
+            num_lap_samples = end_idx - start_idx
+            if num_lap_samples <= 0:
                  continue
-                 
+            # Tempo relativo ao início da volta, calculado de uma vez para toda a fatia
+            relative_times = lap_times[start_idx:end_idx] - lap_times[start_idx]
+
             final_lap_time = lap_times[end_idx - 1] - lap_times[start_idx]
 
             # Extrai setores (se disponível)
             sectors = []
             if sector_ch:
-                sector_numbers = self.samples[sector_ch][lap_slice_indices]
+                sector_numbers = self.samples[sector_ch][start_idx:end_idx]
                 sector_change_indices = np.where(np.diff(sector_numbers) != 0)[0] + 1
                 sector_start_indices = np.insert(sector_change_indices, 0, 0)
-                sector_end_indices = np.append(sector_change_indices, len(lap_slice_indices))
+                sector_end_indices = np.append(sector_change_indices, num_lap_samples)
                 
                 for j in range(len(sector_start_indices)):
                      sec_start = sector_start_indices[j]
                      sec_end = sector_end_indices[j]
                      sector_num = int(sector_numbers[sec_start])
                      if sector_num > 0:
-                          sector_time = lap_times[lap_slice_indices[sec_end - 1]] - lap_times[lap_slice_indices[sec_start]]
+                          sector_time = relative_times[sec_end - 1] - relative_times[sec_start]
                           sectors.append({"sector": sector_num, "time": sector_time})
 
             # Extrai pontos de dados
             data_points = []
-            for k in lap_slice_indices:
+            for k, relative_time in zip(range(start_idx, end_idx), relative_times):
                 point = {
-                    "time": lap_times[k] - lap_times[start_idx], # Tempo relativo ao início da volta
+                    "time": relative_time, # Tempo relativo ao início da volta
                     "distance": float(self.samples[lap_dist_ch][k]) if lap_dist_ch else 0.0,
                     "position": [
                         float(self.samples[pos_x_ch][k]) if pos_x_ch else 0.0,
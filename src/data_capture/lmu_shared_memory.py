@@ -6,17 +6,20 @@ Baseado em pyRfactor2SharedMemory e na estrutura de acc_shared_memory.py.
 """
 
 import os
+import math
+import functools
 import time
 import logging
 import ctypes
 # CORRIGIDO: Adicionado c_short e c_byte à importação
-from ctypes import Structure, c_float, c_int, c_wchar, c_double, c_char, sizeof, byref, c_ubyte, c_short, c_byte
+from ctypes import Structure, c_float, c_int, c_wchar, c_double, c_char, sizeof, byref, c_ubyte, c_short, c_byte, c_uint
 import mmap
+import struct
+import numpy as np
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 import json
 import threading
-import copy
 from enum import Enum
 
 # Adiciona o diretório pai ao path para permitir imports absolutos
@@ -25,6 +28,8 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirna
 
 # Importa a estrutura de dados padronizada
 from src.core.standard_data import TelemetrySession, SessionInfo, TrackData, LapData, DataPoint
+from src.data_capture._struct_fields import compile_field_unpacker
+from src.data_capture._recording import TYRE_TEMP_FIELDS, TYRE_PRESS_FIELDS, LapRecorder
 
 # Configuração de logging
 logger = logging.getLogger(__name__) # Usa o nome do módulo
@@ -82,6 +87,9 @@ class rF2Wheel(Structure):
 class rF2VehicleTelemetry(Structure):
     _pack_ = 4
     _fields_ = [
+        # Cabeçalho do plugin: Begin é incrementado antes da escrita e End depois
+        ("mVersionUpdateBegin", c_uint), ("mVersionUpdateEnd", c_uint),
+        ("mBytesUpdatedHint", c_int), ("mNumVehicles", c_int),
         ("mID", c_int), ("mDeltaTime", c_double), ("mElapsedTime", c_double),
         ("mLapNumber", c_int), ("mLapStartET", c_double),
         ("mVehicleName", c_ubyte * 64), ("mTrackName", c_ubyte * 64),
@@ -144,6 +152,8 @@ class rF2VehicleScoring(Structure):
 class rF2ScoringInfo(Structure):
     _pack_ = 4
     _fields_ = [
+        ("mVersionUpdateBegin", c_uint), ("mVersionUpdateEnd", c_uint),
+        ("mBytesUpdatedHint", c_int),
         ("mTrackName", c_ubyte * 64), ("mSession", c_int), ("mCurrentET", c_double),
         ("mEndET", c_double), ("mMaxLaps", c_int), ("mLapDist", c_double),
         ("mResultsStream", c_ubyte * 8192), # Pode ser útil para resultados pós-sessão
@@ -151,28 +161,128 @@ class rF2ScoringInfo(Structure):
         ("mVehicles", rF2VehicleScoring * rFactor2Constants.MAX_MAPPED_VEHICLES),
     ]
 
+# Tamanhos das estruturas, calculados uma vez na importação
+_TELEMETRY_SIZE = sizeof(rF2VehicleTelemetry)
+_SCORING_SIZE = sizeof(rF2ScoringInfo)
+# Relógios que decidem se há pacote novo: lidos direto do mmap (8 bytes), sem tocar nas estruturas
+_ELAPSED_OFFSET = rF2VehicleTelemetry.mElapsedTime.offset
+_CURRENT_ET_OFFSET = rF2ScoringInfo.mCurrentET.offset
+_unpack_double = struct.Struct("=d").unpack_from
+# (mVersionUpdateBegin, mVersionUpdateEnd): primeiros 8 bytes de cada página do plugin
+_unpack_version = struct.Struct("=II").unpack_from
+
+# Campos do scoring do jogador usados na captura, lidos uma vez por pacote de scoring
+_PLAYER_FIELDS = ("mLapDist", "mTimeIntoLap", "mSector", "mTotalLaps", "mLastLapTime")
+_PLAYER_FAST = compile_field_unpacker(rF2VehicleScoring, _PLAYER_FIELDS)
+_VEHICLE_SIZE = sizeof(rF2VehicleScoring)
+# Tentativas de cópia quando o plugin está no meio de uma escrita (Begin != End)
+_SNAPSHOT_RETRIES = 3
+
+# mVehicles visto como array estruturado do numpy (mesmo layout/offsets do ctypes, _pack_ = 4)
+_VEHICLE_DTYPE = np.dtype(rF2VehicleScoring)
+_VEHICLES_OFFSET = rF2ScoringInfo.mVehicles.offset
+
+# No Linux (Wine/Proton) o plugin só é visível através de uma ponte que expõe cada mapeamento
+# nomeado como arquivo em /dev/shm, com o mesmo nome
+_LINUX_SHM_DIR = "/dev/shm"
+# MAP_POPULATE pré-carrega as páginas no mmap: as faltas de página acontecem no connect,
+# não nas primeiras leituras do loop de captura (constante exposta pelo módulo desde o 3.10)
+_MAP_POPULATE = getattr(mmap, "MAP_POPULATE", 0)
+
+def _open_shared_memory(name: str, size: int) -> mmap.mmap:
+    """Abre o mapeamento `name` do plugin, somente leitura, com `size` bytes."""
+    if sys.platform.startswith("linux"):
+        fd = os.open(os.path.join(_LINUX_SHM_DIR, name), os.O_RDONLY)
+        try:
+            return mmap.mmap(fd, size, flags=mmap.MAP_SHARED | _MAP_POPULATE, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd) # O mmap mantém sua própria referência ao arquivo
+    return mmap.mmap(-1, size, name, access=mmap.ACCESS_READ)
+
+def _map_readonly(cls, mapping: mmap.mmap):
+    """Posiciona uma estrutura `cls` sobre um mmap somente leitura, sem cópia.
+
+    from_buffer exige buffer gravável; aqui a estrutura é criada pelo endereço do mapeamento e
+    guarda o array numpy que exporta o buffer (o mmap não pode ser fechado enquanto ela existir).
+    """
+    buffer = np.frombuffer(mapping, dtype=np.uint8, count=sizeof(cls))
+    view = cls.from_address(buffer.ctypes.data)
+    view._buffer = buffer
+    return view
+
 # --- Função Auxiliar para Decodificar Strings ---
-def decode_string(byte_array: bytes) -> str:
-    """Decodifica um array de bytes (c_ubyte *) para string, parando no nulo."""
+@functools.lru_cache(maxsize=256)
+def _decode_cstring(raw: bytes) -> str:
+    # Nomes de pista/carro/piloto se repetem a sessão inteira: cada valor é decodificado uma vez
+    return raw.partition(b"\x00")[0].decode("utf-8", errors="ignore")
+
+def decode_string(byte_array) -> str:
+    """Decodifica um array de bytes (bytes ou c_ubyte *) para string, parando no nulo."""
     try:
-        null_pos = byte_array.find(b"\x00")
-        if null_pos != -1:
-            return byte_array[:null_pos].decode("utf-8", errors="ignore")
-        else:
-            return byte_array.decode("utf-8", errors="ignore")
+        return _decode_cstring(bytes(byte_array))
     except Exception:
         return ""
 
 # --- Função Auxiliar para Converter ctypes para Nativo ---
+# Blocos brutos/reservados que nenhum consumidor usa (mResultsStream sozinho tem 8 KB)
+_SKIPPED_FIELDS = frozenset(("mResultsStream", "mExpansion", "mUnused", "mDentSeverity",
+                             "mVersionUpdateBegin", "mVersionUpdateEnd", "mBytesUpdatedHint"))
+# Arrays de tamanho fixo cujo número de entradas válidas está em outro campo
+_COUNTED_FIELDS = {"mVehicles": "mNumVehicles"}
+
+_CONVERTERS: Dict[type, Any] = {}
+
+def _native_expr(ctype, expr: str, namespace: Dict[str, Any], depth: int = 0) -> str:
+    """Expressão Python que converte `expr` (valor de um campo do tipo `ctype`) para nativo."""
+    if issubclass(ctype, Structure):
+        name = f"convert_{ctype.__name__}"
+        namespace[name] = struct_converter(ctype)
+        return f"{name}({expr})"
+    if issubclass(ctype, ctypes.Array):
+        item = ctype._type_
+        if item is c_char or item is c_ubyte:
+            # Strings do rF2 são arrays de c_ubyte (os blocos binários ficam em _SKIPPED_FIELDS)
+            return f"decode_string({expr})"
+        if issubclass(item, (Structure, ctypes.Array)):
+            var = f"v{depth}"
+            return f"[{_native_expr(item, var, namespace, depth + 1)} for {var} in {expr}]"
+        return f"{expr}[:]" # Escalares: o fatiamento do ctypes já devolve uma lista nativa
+    if ctype is c_char:
+        return f"decode_string({expr})"
+    return expr # Escalar: o ctypes já devolve int/float
+
+def struct_converter(cls):
+    """Retorna (gerando na primeira chamada) a função que converte `cls` em dict nativo.
+
+    O corpo é gerado (exec) a partir dos _fields_: cada campo vira uma expressão direta,
+    sem isinstance nem recursão genérica por valor.
+    """
+    try:
+        return _CONVERTERS[cls]
+    except KeyError:
+        pass
+    namespace: Dict[str, Any] = {"decode_string": decode_string}
+    items = []
+    for name, ctype in cls._fields_:
+        if name in _SKIPPED_FIELDS:
+            continue
+        count_field = _COUNTED_FIELDS.get(name)
+        if count_field is not None:
+            # Só os slots ocupados (ex.: mNumVehicles de 128 veículos)
+            value = _native_expr(ctype._type_, "v", namespace, 1)
+            items.append(f"{name!r}: [{value} for v in o.{name}[:max(0, o.{count_field})]]")
+        else:
+            items.append(f"{name!r}: {_native_expr(ctype, f'o.{name}', namespace)}")
+    src = "def convert(o):\n    return {" + ", ".join(items) + "}\n"
+    exec(src, namespace)
+    converter = _CONVERTERS[cls] = namespace["convert"]
+    return converter
+
 def convert_ctypes_to_native(obj):
     """Converte recursivamente um objeto ctypes (Structure, Array) para tipos nativos Python."""
     if isinstance(obj, Structure):
-        result = {}
-        for field_name, field_type in obj._fields_:
-            value = getattr(obj, field_name)
-            result[field_name] = convert_ctypes_to_native(value)
-        return result
-    elif isinstance(obj, ctypes.Array):
+        return struct_converter(type(obj))(obj)
+    elif isinstance(obj, (ctypes.Array, list)):
         return [convert_ctypes_to_native(item) for item in obj]
     elif isinstance(obj, bytes):
         return decode_string(obj) # Tenta decodificar bytes como string
@@ -189,16 +299,31 @@ def convert_ctypes_to_native(obj):
 class LMUSharedMemoryReader:
     """Classe para ler dados da memória compartilhada do Le Mans Ultimate (via rF2)."""
 
+    # Intervalo mínimo entre logs de erro repetidos no caminho de leitura (s)
+    ERROR_LOG_INTERVAL_S = 1.0
+
     def __init__(self):
         self.telemetry_mmap = None
         self.scoring_mmap = None
-        self.telemetry_data = rF2VehicleTelemetry() # Apenas para o jogador
+        # Snapshot da telemetria (apenas para o jogador): alocado uma vez e reescrito com
+        # memmove a cada pacote novo; o scoring vira uma view sobre o mmap no connect
+        self.telemetry_data = rF2VehicleTelemetry()
         self.scoring_data = rF2ScoringInfo()
+        self._telemetry_live: Optional[rF2VehicleTelemetry] = None # View que segura o buffer do mmap
+        self._telemetry_src = 0 # Endereço da telemetria na memória compartilhada
 
         self.is_connected = False
         self.last_telemetry_time = -1.0
         self.last_scoring_time = -1.0
         self.player_id = -1 # ID do veículo do jogador
+        self.player_scoring: Optional[rF2VehicleScoring] = None # Scoring do jogador no último pacote
+        self._player_index = -1 # Posição do jogador em mVehicles no último pacote
+        # Valores de _PLAYER_FIELDS do jogador no último pacote de scoring (None sem jogador)
+        self.player_fields: Optional[tuple] = None
+        # Os 128 slots de mVehicles como array estruturado, sem cópia (válidos: [:mNumVehicles])
+        self.vehicles: Optional[np.ndarray] = None
+        self._last_error_log = float("-inf")
+        self._suppressed_errors = 0
 
         logger.info("Inicializando leitor de memória compartilhada do LMU/rF2")
 
@@ -208,27 +333,34 @@ class LMUSharedMemoryReader:
             logger.warning("Já está conectado.")
             return True
         try:
-            # Tenta abrir os arquivos de memória compartilhada
-            self.telemetry_mmap = mmap.mmap(-1, sizeof(rF2VehicleTelemetry), rFactor2Constants.MM_TELEMETRY_FILE_NAME)
-            self.scoring_mmap = mmap.mmap(-1, sizeof(rF2ScoringInfo), rFactor2Constants.MM_SCORING_FILE_NAME)
-
-            # Lê dados iniciais para confirmar
-            self._read_scoring_data()
-            if not self.scoring_data or self.scoring_data.mNumVehicles == 0:
+            # Tenta abrir os arquivos de memória compartilhada (somente leitura: só o plugin escreve)
+            self.telemetry_mmap = _open_shared_memory(rFactor2Constants.MM_TELEMETRY_FILE_NAME, _TELEMETRY_SIZE)
+            self.scoring_mmap = _open_shared_memory(rFactor2Constants.MM_SCORING_FILE_NAME, _SCORING_SIZE)
+
+            # O scoring aponta direto para a memória compartilhada (sem cópia); da telemetria a
+            # view só fornece o endereço de origem da cópia para o snapshot
+            self._telemetry_live = _map_readonly(rF2VehicleTelemetry, self.telemetry_mmap)
+            self._telemetry_src = ctypes.addressof(self._telemetry_live)
+            self._snapshot_telemetry()
+            self.scoring_data = _map_readonly(rF2ScoringInfo, self.scoring_mmap)
+            self.vehicles = np.frombuffer(self.scoring_mmap, dtype=_VEHICLE_DTYPE,
+                                          count=rFactor2Constants.MAX_MAPPED_VEHICLES, offset=_VEHICLES_OFFSET)
+
+            # Confere os dados iniciais
+            if self.scoring_data.mNumVehicles == 0:
                 logger.error("Dados de scoring inválidos ou LMU/rF2 não está em uma sessão ativa.")
                 self._cleanup_memory()
                 return False
 
             # Encontra o ID do jogador (pode ser necessário ler telemetria também)
-            self._read_telemetry_data()
-            self.player_id = self.telemetry_data.mID if self.telemetry_data else -1
+            self.player_id = self.telemetry_data.mID
 
             if self.player_id == -1:
                  # Tenta encontrar pelo scoring se telemetria não deu ID
-                 for i in range(self.scoring_data.mNumVehicles):
-                     if self.scoring_data.mVehicles[i].mIsPlayer:
-                         self.player_id = self.scoring_data.mVehicles[i].mID
-                         break
+                 active = self.vehicles[:self.scoring_data.mNumVehicles]
+                 players = np.flatnonzero(active["mIsPlayer"])
+                 if players.size:
+                     self.player_id = int(active["mID"][players[0]])
                  if self.player_id == -1:
                     logger.error("Não foi possível encontrar o veículo do jogador nos dados.")
                     self._cleanup_memory()
@@ -255,71 +387,201 @@ class LMUSharedMemoryReader:
         logger.info("Desconectado da memória compartilhada do LMU/rF2")
         return True
 
+    def _log_throttled(self, level: int, message: str, exc_info: bool = False):
+        """Loga no máximo uma mensagem por ERROR_LOG_INTERVAL_S; as demais só são contadas.
+
+        Evita que a thread de leitura formate milhares de tracebacks por segundo quando a
+        memória compartilhada fica inválida por alguns instantes.
+        """
+        now = time.monotonic()
+        if now - self._last_error_log < self.ERROR_LOG_INTERVAL_S:
+            self._suppressed_errors += 1
+            return
+        if self._suppressed_errors:
+            message = f"{message} (+{self._suppressed_errors} mensagens suprimidas)"
+            self._suppressed_errors = 0
+        self._last_error_log = now
+        logger.log(level, message, exc_info=exc_info)
+
     def _cleanup_memory(self):
-        if self.telemetry_mmap:
+        # As views exportam o buffer do mmap; precisam ser liberadas antes do close()
+        # (player_scoring é uma sub-estrutura de scoring_data e também segura o buffer)
+        self.player_scoring = None
+        self._player_index = -1
+        self.player_fields = None
+        self.vehicles = None
+        self._telemetry_live = None
+        self._telemetry_src = 0
+        ctypes.memset(ctypes.addressof(self.telemetry_data), 0, _TELEMETRY_SIZE)
+        self.scoring_data = rF2ScoringInfo()
+        if self.telemetry_mmap is not None:
             self.telemetry_mmap.close()
             self.telemetry_mmap = None
-        if self.scoring_mmap:
+        if self.scoring_mmap is not None:
             self.scoring_mmap.close()
             self.scoring_mmap = None
 
-    def _read_telemetry_data(self):
-        if not self.telemetry_mmap:
-            return
-        try:
-            self.telemetry_mmap.seek(0)
-            telemetry_buffer = self.telemetry_mmap.read(sizeof(rF2VehicleTelemetry))
-            self.telemetry_data = rF2VehicleTelemetry.from_buffer_copy(telemetry_buffer)
-        except Exception as e:
-            # logger.warning(f"Erro ao ler dados de telemetria rF2: {e}")
-            self.telemetry_data = None
+    def peek_elapsed_time(self) -> float:
+        """Lê só o mElapsedTime atual da telemetria (8 bytes, direto da memória compartilhada)."""
+        if self.telemetry_mmap is None:
+            return self.telemetry_data.mElapsedTime
+        return _unpack_double(self.telemetry_mmap, _ELAPSED_OFFSET)[0]
+
+    def _snapshot_telemetry(self) -> bool:
+        """Copia a página de telemetria para o snapshot pré-alocado (um memcpy, sem alocação).
+
+        Os campos do DataPoint passam a vir todos do mesmo pacote, em vez de cada acesso ler
+        a memória compartilhada enquanto o plugin a reescreve. Retorna False se todas as
+        tentativas pegaram o plugin no meio de uma escrita (cópia rasgada).
+        """
+        snapshot = self.telemetry_data
+        destination = ctypes.addressof(snapshot)
+        for _ in range(_SNAPSHOT_RETRIES):
+            ctypes.memmove(destination, self._telemetry_src, _TELEMETRY_SIZE)
+            # Begin e End são vizinhos no início da página: na cópia, iguais só dizem que não
+            # havia escrita em andamento quando a cópia começou. Uma escrita iniciada durante
+            # a cópia só aparece no Begin da memória compartilhada, relido depois do memmove
+            begin = snapshot.mVersionUpdateBegin
+            if begin == snapshot.mVersionUpdateEnd and begin == _unpack_version(self.telemetry_mmap)[0]:
+                return True
+        return False
+
+    def _refresh(self) -> tuple:
+        """Verifica cada página separadamente: retorna (telemetria nova, scoring novo).
+
+        A telemetria avança a ~90 Hz e o scoring a ~5 Hz; player_scoring só é procurado de
+        novo quando o scoring muda.
+        """
+        if self.telemetry_mmap is None or self.scoring_mmap is None:
+            return False, False
+        current_telemetry_time = _unpack_double(self.telemetry_mmap, _ELAPSED_OFFSET)[0]
+        current_scoring_time = _unpack_double(self.scoring_mmap, _CURRENT_ET_OFFSET)[0]
+
+        telemetry_updated = current_telemetry_time > self.last_telemetry_time
+        scoring_updated = current_scoring_time > self.last_scoring_time and self._refresh_player()
+        if telemetry_updated:
+            # Cópia rasgada: o pacote é descartado e relido no próximo tick
+            telemetry_updated = self._snapshot_telemetry()
+        if telemetry_updated:
+            # O plugin pode ter publicado outro pacote entre a checagem e a cópia
+            self.last_telemetry_time = self.telemetry_data.mElapsedTime
+        return telemetry_updated, scoring_updated
+
+    def _refresh_player(self) -> bool:
+        """Relê o scoring do jogador dentro de uma janela validada pelo bloco de versão.
+
+        O scoring é lido direto do mmap: Begin é conferido antes e depois da leitura dos campos
+        e, se o plugin começou uma escrita no meio, o pacote é descartado e relido no próximo
+        tick. Retorna True se o pacote foi aceito.
+        """
+        mapping = self.scoring_mmap
+        begin, end = _unpack_version(mapping)
+        if begin != end:
+            return False # Plugin no meio de uma escrita
+        current_scoring_time = _unpack_double(mapping, _CURRENT_ET_OFFSET)[0]
+        player_scoring = self._find_player_scoring()
+        # Os campos do jogador só mudam com o scoring: um unpack_from no offset do veículo
+        # serve todos os ticks de telemetria até o próximo pacote
+        player_fields = (_PLAYER_FAST(mapping, _VEHICLES_OFFSET + self._player_index * _VEHICLE_SIZE)
+                         if player_scoring is not None else None)
+        if _unpack_version(mapping)[0] != begin:
+            return False # Escrita começou durante a leitura: valores possivelmente rasgados
+        self.last_scoring_time = current_scoring_time
+        self.player_scoring = player_scoring
+        self.player_fields = player_fields
+        return True
 
-    def _read_scoring_data(self):
-        if not self.scoring_mmap:
-            return
-        try:
-            self.scoring_mmap.seek(0)
-            scoring_buffer = self.scoring_mmap.read(sizeof(rF2ScoringInfo))
-            self.scoring_data = rF2ScoringInfo.from_buffer_copy(scoring_buffer)
-        except Exception as e:
-            # logger.warning(f"Erro ao ler dados de scoring rF2: {e}")
-            self.scoring_data = None
+    def _find_player_scoring(self) -> Optional[rF2VehicleScoring]:
+        """Retorna o scoring do jogador, reaproveitando o índice do pacote anterior."""
+        scoring = self.scoring_data
+        if not scoring:
+            return None
+        # A ordem de mVehicles raramente muda: valida o índice em cache antes de varrer
+        index = self._player_index
+        if 0 <= index < scoring.mNumVehicles:
+            vehicle = scoring.mVehicles[index]
+            if vehicle.mID == self.player_id:
+                return vehicle
+        # Varredura vetorizada sobre a coluna mID (em C, sem acessar cada estrutura)
+        matches = np.flatnonzero(self.vehicles["mID"][:scoring.mNumVehicles] == self.player_id)
+        if not matches.size:
+            self._player_index = -1
+            return None
+        self._player_index = int(matches[0])
+        return scoring.mVehicles[self._player_index]
 
     def read_data(self) -> Optional[Dict[str, Any]]:
         """Lê os dados mais recentes e retorna um dicionário se houver dados novos."""
         if not self.is_connected:
-            logger.warning("Tentativa de ler dados sem estar conectado.")
+            self._log_throttled(logging.WARNING, "Tentativa de ler dados sem estar conectado.")
             return None
 
-        self._read_telemetry_data()
-        self._read_scoring_data()
-
-        # Verifica se há dados novos (baseado no mElapsedTime da telemetria)
-        current_telemetry_time = self.telemetry_data.mElapsedTime if self.telemetry_data else -1.0
-        current_scoring_time = self.scoring_data.mCurrentET if self.scoring_data else -1.0
-
-        if current_telemetry_time > self.last_telemetry_time or current_scoring_time > self.last_scoring_time:
-            self.last_telemetry_time = current_telemetry_time
-            self.last_scoring_time = current_scoring_time
-
-            # Encontra o scoring do jogador atual
-            player_scoring = None
-            if self.scoring_data:
-                for i in range(self.scoring_data.mNumVehicles):
-                    if self.scoring_data.mVehicles[i].mID == self.player_id:
-                        player_scoring = self.scoring_data.mVehicles[i]
-                        break
-
-            # Retorna uma cópia dos dados lidos em formato nativo Python
-            return {
-                "telemetry": convert_ctypes_to_native(self.telemetry_data) if self.telemetry_data else None,
-                "scoring_info": convert_ctypes_to_native(self.scoring_data) if self.scoring_data else None,
-                "player_scoring": convert_ctypes_to_native(player_scoring) if player_scoring else None
-            }
-        else:
-            # logger.debug("Nenhum dado novo de telemetria ou scoring (tempo igual).")
+        telemetry_updated, scoring_updated = self._refresh()
+        if not telemetry_updated and not scoring_updated:
             return None # Nenhum dado novo
 
+        # Retorna uma cópia dos dados lidos em formato nativo Python; cada página só é
+        # convertida quando ela mesma mudou (o scoring do jogador é pequeno e vai sempre,
+        # pois normalize_to_datapoint precisa dele junto da telemetria)
+        player_scoring = self.player_scoring
+        return {
+            "telemetry": convert_ctypes_to_native(self.telemetry_data) if telemetry_updated and self.telemetry_data else None,
+            "scoring_info": convert_ctypes_to_native(self.scoring_data) if scoring_updated and self.scoring_data else None,
+            "player_scoring": convert_ctypes_to_native(player_scoring) if player_scoring else None
+        }
+
+    def read_datapoint(self) -> Optional[DataPoint]:
+        """Caminho rápido da captura: monta o DataPoint direto das estruturas ctypes.
+
+        Equivalente a normalize_to_datapoint(read_data()), mas sem converter o scoring inteiro
+        (128 veículos + mResultsStream) para dicts a cada tick: só ~15 campos são lidos.
+        """
+        if not self._refresh_point():
+            return None
+        return DataPoint(*self._snapshot_values())
+
+    def read_into(self, buffer: np.ndarray, index: int) -> bool:
+        """Grava o tick novo (se houver) na linha `index` de um array com dtype DP_DTYPE.
+
+        Usado pela captura: nenhum objeto DataPoint é criado por tick.
+        """
+        if not self._refresh_point():
+            return False
+        buffer[index] = self._snapshot_values()
+        return True
+
+    def _refresh_point(self) -> bool:
+        """True se há telemetria nova e o scoring do jogador já é conhecido."""
+        # O DataPoint é guiado pela telemetria: ticks só de scoring não geram ponto
+        return self.is_connected and self._refresh()[0] and self.player_fields is not None
+
+    def _snapshot_values(self) -> tuple:
+        """Valores do snapshot atual na ordem dos campos de DataPoint (e de DP_DTYPE)."""
+        telemetry = self.telemetry_data
+        lap_dist, time_into_lap, sector, _, _ = self.player_fields
+        pos = telemetry.mPos
+        vel = telemetry.mLocalVel
+        wheels = telemetry.mWheels[:] # FL, FR, RL, RR
+        return (
+            int(telemetry.mElapsedTime * 1000),
+            lap_dist,
+            int(time_into_lap * 1000),
+            sector,
+            pos.x,
+            pos.y,
+            pos.z,
+            # Velocidade: rF2 fornece mLocalVel (m/s), converter para km/h
+            math.sqrt(vel.x * vel.x + vel.y * vel.y + vel.z * vel.z) * 3.6,
+            int(telemetry.mEngineRPM),
+            telemetry.mGear,
+            telemetry.mFilteredSteering,
+            telemetry.mFilteredThrottle,
+            telemetry.mFilteredBrake,
+            telemetry.mFilteredClutch,
+            *[wheel.mTemperature[1] for wheel in wheels], # [0]=FL, [1]=Centro?
+            *[wheel.mPressure * 1000 for wheel in wheels], # kPa para Pa?
+        )
+
     def normalize_to_datapoint(self, raw_data: Dict[str, Any]) -> Optional[DataPoint]:
         """Converte os dados brutos lidos em um objeto DataPoint padronizado."""
         if not raw_data or "telemetry" not in raw_data or "player_scoring" not in raw_data:
@@ -332,6 +594,18 @@ class LMUSharedMemoryReader:
              return None
 
         try:
+            vel = telemetry.get("mLocalVel")
+            if vel:
+                vx, vy, vz = vel["x"], vel["y"], vel["z"]
+                speed_kmh = math.sqrt(vx * vx + vy * vy + vz * vz) * 3.6
+            else:
+                speed_kmh = 0.0
+
+            # Pneus na ordem do rF2: FL, FR, RL, RR
+            wheels = telemetry.get("mWheels") or []
+            tyres = dict(zip(TYRE_TEMP_FIELDS, (wheel["mTemperature"][1] for wheel in wheels))) # [1]=Centro?
+            tyres.update(zip(TYRE_PRESS_FIELDS, (wheel["mPressure"] * 1000 for wheel in wheels))) # kPa para Pa?
+
             # Mapeamento dos campos LMU/rF2 para DataPoint
             datapoint = DataPoint(
                 timestamp_ms=int(telemetry.get("mElapsedTime", 0.0) * 1000),
@@ -342,53 +616,50 @@ class LMUSharedMemoryReader:
                 pos_y=telemetry["mPos"]["y"] if telemetry.get("mPos") else 0.0,
                 pos_z=telemetry["mPos"]["z"] if telemetry.get("mPos") else 0.0,
                 # Velocidade: rF2 fornece mLocalVel (m/s), converter para km/h
-                speed_kmh=( (telemetry["mLocalVel"]["x"]**2 + telemetry["mLocalVel"]["y"]**2 + telemetry["mLocalVel"]["z"]**2)**0.5 * 3.6 )
-                           if telemetry.get("mLocalVel") else 0.0,
+                speed_kmh=speed_kmh,
                 rpm=int(telemetry.get("mEngineRPM", 0)),
                 gear=telemetry.get("mGear", 0),
                 steer_angle=telemetry.get("mFilteredSteering", 0.0), # Usar filtrado?
                 throttle=telemetry.get("mFilteredThrottle", 0.0),
                 brake=telemetry.get("mFilteredBrake", 0.0),
                 clutch=telemetry.get("mFilteredClutch", 0.0),
-                # Dados de pneus (exemplo - pegar FL)
-                tyre_temp_fl=telemetry["mWheels"][0]["mTemperature"][1] # [0]=FL, [1]=Centro?
-                               if telemetry.get("mWheels") and len(telemetry["mWheels"]) > 0 and len(telemetry["mWheels"][0].get("mTemperature", [])) > 1 else None,
-                tyre_press_fl=telemetry["mWheels"][0]["mPressure"] * 1000 # kPa para Pa?
-                                if telemetry.get("mWheels") and len(telemetry["mWheels"]) > 0 else None,
-                # ... adicionar outros pneus e canais conforme necessário
+                # ... adicionar outros canais conforme necessário
+                **tyres,
             )
             return datapoint
         except KeyError as e:
-            logger.warning(f"Chave ausente ao normalizar dados LMU/rF2: {e}")
+            self._log_throttled(logging.WARNING, f"Chave ausente ao normalizar dados LMU/rF2: {e}")
             return None
         except Exception as e:
-            logger.exception(f"Erro ao normalizar dados LMU/rF2 para DataPoint: {e}")
+            self._log_throttled(logging.ERROR, f"Erro ao normalizar dados LMU/rF2 para DataPoint: {e}", exc_info=True)
             return None
 
 # --- Captura de Telemetria em Tempo Real ---
-class LMUTelemetryCapture:
+class LMUTelemetryCapture(LapRecorder):
     """Captura de telemetria em tempo real do LMU/rF2 via memória compartilhada."""
 
+    # Espera entre consultas ao relógio da telemetria quando não há tick novo (s).
+    # 2 ms limitam o laço ocioso a ~500 despertares/s e atrasam um pacote novo em no máximo isso
+    IDLE_WAIT_S = 0.002
+
     def __init__(self):
+        super().__init__()
         self.reader = LMUSharedMemoryReader()
         self.is_connected = False
         self.is_capturing = False
         self.capture_thread = None
         self.stop_event = threading.Event()
-        self.data_lock = threading.Lock()
-        self.telemetry_data = {"session": {}, "laps": []}
-        self.current_lap_points = []
         self.last_lap = 0
 
     def connect(self) -> bool:
         self.is_connected = self.reader.connect()
         if self.is_connected:
             scoring = self.reader.scoring_data
-            self.telemetry_data["session"] = {
+            self._publish_session({
                 "track": decode_string(scoring.mTrackName) if scoring else "",
                 "car": "",
                 "player": "",
-            }
+            })
         return self.is_connected
 
     def disconnect(self) -> bool:
@@ -415,29 +686,20 @@ class LMUTelemetryCapture:
         self.is_capturing = False
         return True
 
-    def get_telemetry_data(self):
-        with self.data_lock:
-            return copy.deepcopy(self.telemetry_data)
-
     def _capture_loop(self):
         while not self.stop_event.is_set():
-            raw = self.reader.read_data()
-            if raw:
-                dp = self.reader.normalize_to_datapoint(raw)
-                if dp:
-                    with self.data_lock:
-                        lap = raw["player_scoring"].get("mTotalLaps", 0)
-                        if lap != self.last_lap and self.current_lap_points:
-                            self.telemetry_data["laps"].append({
-                                "lap_number": self.last_lap,
-                                "lap_time": raw["player_scoring"].get("mLastLapTime", 0),
-                                "sectors": [],
-                                "data_points": [p.__dict__ for p in self.current_lap_points]
-                            })
-                            self.current_lap_points = []
-                        self.current_lap_points.append(dp)
-                        self.last_lap = lap
-            time.sleep(0.05)
+            # Grava o tick direto na próxima linha do buffer (sem converter o scoring para dicts).
+            # Sem tick novo, read_into só compara os relógios da telemetria e do scoring
+            points, index = self._next_row()
+            if not self.reader.read_into(points, index):
+                self.stop_event.wait(self.IDLE_WAIT_S) # Acorda na hora se a captura parar
+                continue
+            _, _, _, lap, last_lap_time = self.reader.player_fields
+            if lap != self.last_lap and index:
+                # O tick novo (já gravado em index) abre a próxima volta
+                index = self._close_lap(points, index, self.last_lap, last_lap_time, [])
+            self._commit_row(points, index)
+            self.last_lap = lap
 
 # --- Exemplo de Uso (para teste direto do módulo) ---
 if __name__ == "__main__":
@@ -446,8 +708,8 @@ if __name__ == "__main__":
 
     if reader.connect():
         print("Conectado com sucesso!")
-        scoring_native = convert_ctypes_to_native(reader.scoring_data)
-        track_name = scoring_native.get("mTrackName", "N/A")
+        # Só o nome da pista: lido direto da estrutura, sem converter o scoring inteiro
+        track_name = decode_string(reader.scoring_data.mTrackName) or "N/A"
         print(f"Track: {track_name}")
         print(f"Player ID: {reader.player_id}")
         print("Lendo dados por 10 segundos...")
@@ -456,7 +718,14 @@ if __name__ == "__main__":
         last_print_time = 0
         packets_read = 0
 
+        last_elapsed = -1.0
         while time.time() - start_time < 10:
+            # Só faz a leitura completa quando o relógio da telemetria avança
+            elapsed = reader.peek_elapsed_time()
+            if elapsed == last_elapsed:
+                time.sleep(0.001)
+                continue
+            last_elapsed = elapsed
             raw_data = reader.read_data() # Retorna dados nativos Python
             if raw_data:
                 packets_read += 1
@@ -488,7 +757,6 @@ if __name__ == "__main__":
                     else:
                         print("Falha ao normalizar DataPoint")
                     last_print_time = time.time()
-            time.sleep(0.01)
 
         print(f"\nLeitura concluída. {packets_read} pacotes lidos em 10 segundos.")
         reader.disconnect()
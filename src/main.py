@@ -6,6 +6,8 @@ Inicializa a aplicação e a interface gráfica, integrando o fluxo de importaç
 
 import os
 import sys
+import time
+import ctypes
 import logging
 from datetime import datetime
 import numpy as np # Necessário para o código de exemplo do AnalysisWidget
@@ -61,6 +63,20 @@ except ImportError as e:
         pass
     sys.exit(1)
 
+def _set_timer_resolution(high: bool) -> bool:
+    """No Windows, liga (ou desliga) a resolução de 1 ms do timer do sistema (padrão ~15,6 ms).
+
+    Retorna True se a resolução foi alterada; em outros sistemas não faz nada.
+    """
+    if sys.platform != "win32":
+        return False
+    try:
+        winmm = ctypes.windll.winmm
+        (winmm.timeBeginPeriod if high else winmm.timeEndPeriod)(1)
+        return True
+    except (AttributeError, OSError):
+        return False
+
 # --- Classe para Captura em Background (Exemplo) ---
 class CaptureThread(QThread):
     """Thread para executar a leitura da memória compartilhada em background."""
@@ -68,6 +84,9 @@ class CaptureThread(QThread):
     capture_error = pyqtSignal(str) # Sinal emitido em caso de erro
     capture_stopped = pyqtSignal() # Sinal emitido quando a captura para
 
+    # Período entre leituras da memória compartilhada (60 Hz)
+    READ_PERIOD_S = 1.0 / 60.0
+
     def __init__(self, source: str):
         super().__init__()
         self.source = source
@@ -77,6 +96,7 @@ class CaptureThread(QThread):
     def run(self):
         logger.info(f"Iniciando thread de captura para {self.source}")
         self.running = True
+        timer_resolution_set = False
         try:
             if self.source == "ACC":
                 self.reader = ACCSharedMemoryReader()
@@ -90,19 +110,30 @@ class CaptureThread(QThread):
                  self.running = False
                  return
 
+            timer_resolution_set = _set_timer_resolution(True)
+            period = self.READ_PERIOD_S
+            next_tick = time.perf_counter()
             while self.running:
                 data = self.reader.read_data()
                 if data:
                     # TODO: Normalizar os dados lidos para o formato DataPoint
                     # Por enquanto, apenas emite o dicionário bruto
                     self.data_updated.emit(data)
-                # Controla a frequência de leitura (ex: 60Hz)
-                self.msleep(16) # Aproximadamente 60 leituras por segundo
+                # Controla a frequência de leitura com prazos absolutos: o tempo gasto na
+                # leitura e os atrasos do sleep não se acumulam de um ciclo para o outro
+                next_tick += period
+                slack = next_tick - time.perf_counter()
+                if slack > 0:
+                    time.sleep(slack)
+                elif slack < -period:
+                    next_tick = time.perf_counter() # Travou mais de um ciclo: não recupera em rajada
 
         except Exception as e:
             logger.exception(f"Erro na thread de captura {self.source}: {e}")
             self.capture_error.emit(f"Erro durante a captura de {self.source}: {e}")
         finally:
+            if timer_resolution_set:
+                _set_timer_resolution(False)
             if self.reader:
                 self.reader.disconnect()
             logger.info(f"Thread de captura para {self.source} finalizada.")
@@ -2,15 +2,19 @@
 """Módulo responsável pelo processamento e análise dos dados de telemetria padronizados."""
 
 import logging
+from operator import attrgetter
 from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
-import pandas as pd # Usar pandas pode facilitar manipulações
 
 # Importa as estruturas de dados padronizadas
 from src.core.standard_data import TelemetrySession, LapData, DataPoint, TrackData
 
 logger = logging.getLogger(__name__)
 
+# Campos do DataPoint usados no processamento de uma volta
+_LAP_FIELDS = ('timestamp_ms', 'distance_m', 'speed_kmh', 'rpm', 'gear', 'throttle',
+               'brake', 'steer_angle', 'clutch', 'pos_x', 'pos_y', 'sector')
+
 class TelemetryProcessor:
     """Processa e analisa dados de uma sessão de telemetria padronizada."""
 
@@ -43,53 +47,50 @@ class TelemetryProcessor:
             logger.warning(f"Volta {lap.lap_number} sem data_points para processar.")
             return {}
 
-        df = pd.DataFrame([vars(p) for p in lap.data_points])
-
-        if df.empty:
-             logger.warning(f"DataFrame vazio para a volta {lap.lap_number}.")
-             return {}
+        # Transpõe os pontos em colunas (uma lista por campo), sem DataFrame intermediário
+        columns = dict(zip(_LAP_FIELDS, zip(*map(attrgetter(*_LAP_FIELDS), lap.data_points))))
 
         processed = {}
 
         # 1. Extração de Canais Essenciais (padronizado)
-        processed['timestamps_ms'] = df.get('timestamp_ms', pd.Series([0]*len(df))).to_list()
-        processed['distance_m'] = df.get('distance_m', pd.Series([0.0]*len(df))).to_list()
-        processed['speed_kmh'] = df.get('speed_kmh', pd.Series([0.0]*len(df))).to_list()
-        processed['rpm'] = df.get('rpm', pd.Series([0]*len(df))).to_list()
-        processed['gear'] = df.get('gear', pd.Series([0]*len(df))).to_list()
-        processed['throttle'] = df.get('throttle', pd.Series([0.0]*len(df))).to_list()
-        processed['brake'] = df.get('brake', pd.Series([0.0]*len(df))).to_list()
-        processed['steer_angle'] = df.get('steer_angle', pd.Series([0.0]*len(df))).to_list()
-        processed['clutch'] = df.get('clutch', pd.Series([0.0]*len(df))).to_list()
+        processed['timestamps_ms'] = list(columns['timestamp_ms'])
+        processed['distance_m'] = list(columns['distance_m'])
+        processed['speed_kmh'] = list(columns['speed_kmh'])
+        processed['rpm'] = list(columns['rpm'])
+        processed['gear'] = list(columns['gear'])
+        processed['throttle'] = list(columns['throttle'])
+        processed['brake'] = list(columns['brake'])
+        processed['steer_angle'] = list(columns['steer_angle'])
+        processed['clutch'] = list(columns['clutch'])
 
         # 2. Geração do Traçado do Piloto (X, Y)
-        processed['driver_trace_xy'] = list(zip(df.get('pos_x', pd.Series([0.0]*len(df))),
-                                                df.get('pos_y', pd.Series([0.0]*len(df)))))
+        processed['driver_trace_xy'] = list(zip(columns['pos_x'], columns['pos_y']))
 
         # 3. Cálculo de Velocidade em Curvas (Exemplo simples: velocidade mínima em segmentos)
-        processed['sector_speeds'] = self._calculate_sector_speeds(df, lap.sector_times_ms)
+        processed['sector_speeds'] = self._calculate_sector_speeds(
+            np.asarray(columns['sector']), np.asarray(columns['speed_kmh'], dtype=np.float64), lap.sector_times_ms)
 
         processed['lap_time_ms'] = lap.lap_time_ms
         processed['sector_times_ms'] = lap.sector_times_ms
 
         return processed
 
-    def _calculate_sector_speeds(self, df: pd.DataFrame, sector_times_ms: List[int]) -> List[Dict[str, float]]:
+    def _calculate_sector_speeds(self, sectors: np.ndarray, speeds: np.ndarray, sector_times_ms: List[int]) -> List[Dict[str, float]]:
         """Calcula estatísticas de velocidade por setor."""
         sector_speeds_stats = []
-        if 'sector' not in df.columns or not sector_times_ms:
+        if not sector_times_ms:
             return sector_speeds_stats
 
-        unique_sectors = sorted(df['sector'].unique())
+        unique_sectors = np.unique(sectors)
         for i, sector_num in enumerate(unique_sectors):
             if sector_num <= 0: continue # Ignora setor 0 (geralmente pit/inválido)
-            sector_df = df[df['sector'] == sector_num]
-            if not sector_df.empty:
+            sector_speeds = speeds[sectors == sector_num]
+            if sector_speeds.size:
                 stats = {
                     'sector': sector_num,
-                    'avg_speed_kmh': sector_df['speed_kmh'].mean(),
-                    'min_speed_kmh': sector_df['speed_kmh'].min(),
-                    'max_speed_kmh': sector_df['speed_kmh'].max(),
+                    'avg_speed_kmh': sector_speeds.mean(),
+                    'min_speed_kmh': sector_speeds.min(),
+                    'max_speed_kmh': sector_speeds.max(),
                     'time_ms': sector_times_ms[i-1] if i > 0 and i <= len(sector_times_ms) else None # Associa tempo se disponível
                 }
                 sector_speeds_stats.append(stats)
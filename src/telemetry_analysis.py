@@ -3,6 +3,7 @@ Módulo de análise avançada de telemetria para o Race Telemetry Analyzer.
 Responsável por analisar pedais, setores e identificar erros de pilotagem.
 """
 
+import math
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple, Union
@@ -349,4 +350,4 @@ class TelemetryAnalyzer:
 
     def _calculate_distance(self, pos1: List[float], pos2: List[float]) -> float:
         """Calcula a distância euclidiana entre dois pontos."""
-        return np.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
+        return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
@@ -3,6 +3,7 @@ Módulo de comparação de telemetria para o Race Telemetry Analyzer.
 Responsável por comparar dados de telemetria entre diferentes voltas e identificar pontos de melhoria.
 """
 
+import math
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple, Union
@@ -911,4 +912,4 @@ class TelemetryComparison:
         Returns:
             Distância entre os pontos
         """
-        return np.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
+        return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
@@ -8,6 +8,7 @@ import os
 import sys
 import logging
 import json
+from dataclasses import asdict
 from datetime import datetime
 
 # Configurar logging (CORRIGIDO)
@@ -68,7 +69,7 @@ def test_motec_parser(file_path):
                     logger.info("Canais disponíveis no primeiro ponto:")
 
                     # Converter para dict e exibir as chaves (nomes dos canais)
-                    point_dict = first_point.__dict__
+                    point_dict = asdict(first_point)
                     for key in point_dict.keys():
                         logger.info(f"  - {key}")
 
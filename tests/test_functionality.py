@@ -31,6 +31,36 @@ except ImportError:
     LDParser = None
     capture_available = False
 
+try:
+    import struct
+    import numpy as np
+    from src.data_acquisition.parsers import MotecParser, _ldHead, _ldChan
+    from src.data_acquisition.normalizer import TelemetryNormalizer
+    parsers_available = True
+except ImportError:
+    print("AVISO: Módulo de parsers não encontrado. Alguns testes serão ignorados.")
+    MotecParser = None
+    parsers_available = False
+
+try:
+    import numpy as np
+    from src.data_capture._recording import DP_DTYPE, DP_FIELDS, LapRecorder, records_to_dicts
+    recording_available = True
+except ImportError:
+    LapRecorder = None
+    recording_available = False
+
+try:
+    import ctypes
+    import mmap
+    import struct
+    from src.data_capture import lmu_shared_memory as lmu
+    # O leitor mapeia /dev/shm no Linux: os testes trocam o diretório por um temporário
+    lmu_reader_available = sys.platform.startswith("linux")
+except ImportError:
+    lmu = None
+    lmu_reader_available = False
+
 
 class TestCaptureManager(unittest.TestCase):
     """Testes para o gerenciador de captura."""
@@ -158,6 +188,40 @@ class TestACCTelemetryCapture(unittest.TestCase):
         # Mas o importante é que o método não lance exceções
         print("✓ Método de conexão ACC executado sem erros")
 
+    @unittest.skipIf(not capture_available, "Módulo ACC não disponível")
+    def test_acc_field_unpacker(self):
+        """Testa a leitura parcial dos campos da página de física via struct."""
+        from src.data_capture.acc_shared_memory import SPageFilePhysics, compile_field_unpacker
+
+        physics = SPageFilePhysics()
+        physics.speedKmh = 210.5
+        physics.gear = 5
+        physics.rpms = 7200
+        for i in range(4):
+            physics.wheelsPressure[i] = 27.0 + i
+
+        read = compile_field_unpacker(SPageFilePhysics, ("speedKmh", "wheelsPressure", "gear", "rpms"))
+        self.assertEqual(read(physics), (210.5, 27.0, 28.0, 29.0, 30.0, 5, 7200))
+        print("✓ Leitura parcial da página de física do ACC correta")
+
+    @unittest.skipIf(not capture_available, "Módulo ACC não disponível")
+    def test_lap_sector_times(self):
+        """Testa os tempos de setor calculados sobre os pontos de uma volta."""
+        from src.data_capture.acc_shared_memory import lap_sector_times
+
+        records = np.zeros(5, dtype=DP_DTYPE)
+        records["sector"] = [0, 0, 1, 1, 2]
+        # O 1º ponto chega com o relógio da volta já andando: o setor 1 conta desde 0
+        records["lap_time_ms"] = [100, 200, 300, 400, 500]
+
+        self.assertEqual(lap_sector_times(records, 800), [
+            {"sector": 1, "time": 0.3},
+            {"sector": 2, "time": 0.2},
+            {"sector": 3, "time": 0.3}, # Termina no tempo oficial da volta
+        ])
+        self.assertEqual(lap_sector_times(records[:0], 800), [])
+        print("✓ Tempos de setor da volta ACC corretos")
+
 
 class TestLMUTelemetryCapture(unittest.TestCase):
     """Testes para a captura de telemetria do LMU."""
@@ -346,6 +410,398 @@ class TestSetupManagement(unittest.TestCase):
             self.fail(f"Falha ao importar setup: {str(e)}")
 
 
+class TestMotecParser(unittest.TestCase):
+    """Testes para o parser de arquivos MoTeC .ld/.ldx."""
+
+    NUM_SAMPLES = 1000
+    LAPS = [(0, 399, 40.0), (400, 799, 39.5)]
+
+    def setUp(self):
+        """Cria um par .ld/.ldx sintético no layout lido pelo parser."""
+        self.test_dir = tempfile.mkdtemp()
+        self.ld_file = os.path.join(self.test_dir, "example.ld")
+        n = self.NUM_SAMPLES
+
+        # (nome, dtype_a, tamanho, freq, shift, mul, scale, dec, dados)
+        channels = [
+            ("Time", 0x07, 4, 100, 0, 1, 1, 0, np.arange(n, dtype=np.float32) / 100),
+            ("Ground Speed", 0x07, 4, 100, 0, 1, 1, 0, np.linspace(0, 250, n).astype(np.float32)),
+            ("RPM", 0x03, 4, 100, 0, 1, 1, 0, (np.arange(n) * 7).astype(np.int32)),
+            ("Throttle Pos", 0x00, 2, 100, 0, 1, 10, 1, (np.arange(n) % 1000).astype(np.int16)),
+        ]
+
+        head_size = struct.calcsize(_ldHead.fmt)
+        chan_size = struct.calcsize(_ldChan.fmt)
+        meta_ptr = MotecParser.FIRST_CHANNEL_OFFSET_GUESS
+        data_ptr = meta_ptr + chan_size * len(channels)
+
+        buf = bytearray(data_ptr)
+        buf[0:head_size] = struct.pack(
+            _ldHead.fmt, 0x40, meta_ptr, data_ptr, head_size, 0, 0, 0, 1, b"ADL", 1, 0, len(channels),
+            b"16/10/2026", b"12:30:00", b"Teste", b"ford_mustang_gt3", b"monza", 0, b"")
+        event = struct.pack("<64s64s1024sH", b"Evento", b"Race", b"", 0)
+        buf[head_size:head_size + len(event)] = event
+
+        for i, (name, dtype_a, size, freq, shift, mul, scale, dec, data) in enumerate(channels):
+            ptr = meta_ptr + i * chan_size
+            next_ptr = ptr + chan_size if i + 1 < len(channels) else 0
+            buf[ptr:ptr + chan_size] = struct.pack(
+                _ldChan.fmt, 0, next_ptr, len(buf), n, 0, dtype_a, size, freq,
+                shift, mul, scale, dec, name.encode(), name[:8].encode(), b"")
+            buf += data.tobytes()
+
+        with open(self.ld_file, "wb") as f:
+            f.write(buf)
+
+        ldx = bytearray(16)
+        for start, end, lap_time in self.LAPS:
+            ldx += struct.pack("<IIf", start, end, lap_time)
+        with open(self.ld_file + "x", "wb") as f:
+            f.write(ldx)
+
+    def tearDown(self):
+        """Limpeza após os testes."""
+        shutil.rmtree(self.test_dir)
+
+    @unittest.skipIf(not parsers_available, "Módulo de parsers não disponível")
+    def test_parse_ld_with_ldx(self):
+        """Testa o parsing por volta de um arquivo LD com LDX."""
+        session = MotecParser().parse(self.ld_file)
+
+        self.assertIsNotNone(session)
+        self.assertEqual(session.session_info.track, "monza")
+        self.assertEqual(session.session_info.session_type, "Race")
+        self.assertEqual(len(session.laps), 2)
+
+        lap = session.laps[1]
+        self.assertEqual(lap.lap_time_ms, 39500)
+        self.assertEqual(len(lap.data_points), 400)
+        point = lap.data_points[10]
+        self.assertEqual(point.rpm, 410 * 7)
+        self.assertAlmostEqual(point.throttle, 4.1, places=4)
+        self.assertAlmostEqual(point.timestamp_ms, 4100, delta=1)
+        print("✓ Parsing MoTeC LD/LDX funcionando corretamente")
+
+    @unittest.skipIf(not parsers_available, "Módulo de parsers não disponível")
+    def test_parse_ld_without_ldx(self):
+        """Testa o parsing da sessão inteira quando não há LDX."""
+        os.remove(self.ld_file + "x")
+        session = MotecParser().parse(self.ld_file)
+
+        self.assertIsNotNone(session)
+        self.assertEqual(len(session.laps), 1)
+        self.assertEqual(len(session.laps[0].data_points), self.NUM_SAMPLES)
+        print("✓ Parsing MoTeC sem LDX funcionando corretamente")
+
+    @unittest.skipIf(not parsers_available, "Módulo de parsers não disponível")
+    def test_parse_cache(self):
+        """Testa a reutilização da sessão para arquivos inalterados."""
+        first = MotecParser().parse(self.ld_file)
+        cached = MotecParser().parse(self.ld_file)
+        self.assertIsNot(cached, first)
+        self.assertEqual(cached, first)
+        self.assertIs(cached.laps[0].data_points[0], first.laps[0].data_points[0])
+
+        # Alterações de um chamador não vazam para a entrada do cache
+        first.laps[0].data_points.clear()
+        first.laps.pop()
+        first.track_data.sector_markers_m.append(123.0)
+        again = MotecParser().parse(self.ld_file)
+        self.assertEqual(len(again.laps), 2)
+        self.assertEqual(len(again.laps[0].data_points), len(cached.laps[0].data_points))
+        self.assertEqual(again.track_data.sector_markers_m, cached.track_data.sector_markers_m)
+
+        # Alterar o LDX invalida a entrada do cache
+        with open(self.ld_file + "x", "ab") as f:
+            f.write(struct.pack("<IIf", 800, 999, 20.0))
+        second = MotecParser().parse(self.ld_file)
+        self.assertIsNot(second, first)
+        self.assertEqual(len(second.laps), 3)
+        print("✓ Cache de parsing MoTeC funcionando corretamente")
+
+class TestTelemetryNormalizer(unittest.TestCase):
+    """Testes para a montagem de DataPoints por colunas no normalizador."""
+
+    @unittest.skipIf(not parsers_available, "Módulo de parsers não disponível")
+    def test_lap_points_with_nan_and_short_channels(self):
+        """Testa canais inteiros com NaN e canais mais curtos que a volta."""
+        channels = {
+            "timestamp_s": np.array([10.0, 10.1, np.nan, 10.3]),
+            "gear": np.array([2.0, np.nan, 3.0, np.inf]),
+            "rpm": np.array([5000.0, 5100.0]), # Mais curto que a volta
+            "speed_kmh": np.array([100.0, np.nan, 102.0, 103.0]),
+        }
+        points = TelemetryNormalizer()._create_lap_data_points(channels, 0, 4, 10.0)
+
+        self.assertEqual(len(points), 4)
+        self.assertEqual([p.gear for p in points], [2, 0, 3, 0])
+        self.assertEqual([p.rpm for p in points], [5000, 5100, 0, 0])
+        self.assertEqual([p.timestamp_ms for p in points], [10000, 10100, 0, 10300])
+        self.assertAlmostEqual(points[1].lap_time_ms, 100, delta=1)
+        self.assertTrue(np.isnan(points[1].speed_kmh)) # Floats mantêm o NaN
+        print("✓ Normalização de canais com NaN funcionando corretamente")
+
+
+@unittest.skipIf(not recording_available, "Módulo de gravação de voltas não disponível")
+class TestLapRecorder(unittest.TestCase):
+    """Testes do buffer de voltas compartilhado pelas capturas do ACC e do LMU."""
+
+    def _record(self, recorder, timestamp_ms, close_lap=None):
+        """Grava um ponto como a thread de captura; `close_lap` = (número, tempo) fecha a volta antes."""
+        points, index = recorder._next_row()
+        points[index]["timestamp_ms"] = timestamp_ms
+        if close_lap is not None and index:
+            index = recorder._close_lap(points, index, close_lap[0], close_lap[1], [])
+        recorder._commit_row(points, index)
+
+    def test_close_lap_carries_rollover_point(self):
+        """Testa a publicação da volta e o ponto que abre a próxima."""
+        recorder = LapRecorder()
+        for timestamp in (0, 1, 2):
+            self._record(recorder, timestamp)
+        self._record(recorder, 99, close_lap=(0, 95.5))
+
+        laps = recorder.telemetry_data["laps"]
+        self.assertEqual(len(laps), 1)
+        self.assertEqual((laps[0]["lap_number"], laps[0]["lap_time"]), (0, 95.5))
+        self.assertEqual(laps[0]["data_points"]["timestamp_ms"].tolist(), [0, 1, 2])
+        self.assertEqual(recorder.get_current_lap_points()["timestamp_ms"].tolist(), [99])
+        self.assertEqual(recorder.get_latest_datapoint().timestamp_ms, 99)
+
+        self._record(recorder, 100)
+        self.assertEqual(recorder.get_current_lap_points()["timestamp_ms"].tolist(), [99, 100])
+        # A volta publicada é uma cópia: o buffer reutilizado não a altera
+        self.assertEqual(laps[0]["data_points"]["timestamp_ms"].tolist(), [0, 1, 2])
+        print("✓ Fechamento de volta no LapRecorder funcionando corretamente")
+
+    def test_close_lap_resets_count_before_rollover(self):
+        """Testa que uma cópia sem lock durante o fechamento nunca mistura as duas voltas."""
+        recorder = LapRecorder()
+        seen = []
+
+        class RolloverSpy(np.ndarray):
+            # Copia a volta atual logo depois de a linha 0 ser reescrita, como a UI faria
+            def __setitem__(self, key, value):
+                super().__setitem__(key, value)
+                if key == 0:
+                    seen.append(recorder.get_current_lap_points()["timestamp_ms"].tolist())
+
+        recorder.current_lap_points = recorder.current_lap_points.view(RolloverSpy)
+        for timestamp in (0, 1, 2):
+            self._record(recorder, timestamp)
+        self._record(recorder, 99, close_lap=(0, 95.5))
+
+        self.assertEqual(seen, [[]])
+        self.assertEqual(recorder.telemetry_data["laps"][0]["data_points"]["timestamp_ms"].tolist(), [0, 1, 2])
+        print("✓ Contagem da volta zerada antes de reaproveitar o buffer")
+
+    def test_buffer_grows_past_initial_size(self):
+        """Testa que o buffer dobra quando a volta passa de LAP_BUFFER_SIZE pontos."""
+        class SmallRecorder(LapRecorder):
+            LAP_BUFFER_SIZE = 4
+
+        recorder = SmallRecorder()
+        for timestamp in range(9):
+            self._record(recorder, timestamp)
+        self.assertEqual(len(recorder.current_lap_points), 16)
+        self.assertEqual(recorder.current_lap_count, 9)
+        self.assertEqual(recorder.get_current_lap_points()["timestamp_ms"].tolist(), list(range(9)))
+        print("✓ Crescimento do buffer de volta funcionando corretamente")
+
+    def test_telemetry_data_serialization_cache(self):
+        """Testa que cada volta é serializada uma vez e de novo só se o array mudar."""
+        recorder = LapRecorder()
+        self.assertIsNone(recorder.get_latest_datapoint())
+        recorder._publish_session({"track": "spa"})
+        for timestamp in (0, 1):
+            self._record(recorder, timestamp)
+        self._record(recorder, 2, close_lap=(0, 90.0))
+
+        first = recorder.get_telemetry_data()
+        self.assertEqual(first["session"], {"track": "spa"})
+        self.assertEqual([point["timestamp_ms"] for point in first["laps"][0]["data_points"]], [0, 1])
+        self.assertEqual(list(first["laps"][0]["data_points"][0]), list(DP_FIELDS))
+        second = recorder.get_telemetry_data()
+        self.assertIsNot(second["laps"][0], first["laps"][0])
+        self.assertIs(second["laps"][0]["data_points"], first["laps"][0]["data_points"])
+
+        # Mesma volta com outro array (ex.: nova captura): a entrada do cache é refeita
+        records = np.zeros(3, dtype=DP_DTYPE)
+        records["timestamp_ms"] = [5, 6, 7]
+        recorder.telemetry_data = {"session": {}, "laps": [dict(recorder.telemetry_data["laps"][0], data_points=records)]}
+        third = recorder.get_telemetry_data()
+        self.assertIsNot(third["laps"][0]["data_points"], first["laps"][0]["data_points"])
+        self.assertEqual([point["timestamp_ms"] for point in third["laps"][0]["data_points"]], [5, 6, 7])
+        print("✓ Cache de serialização das voltas funcionando corretamente")
+
+
+@unittest.skipIf(not lmu_reader_available, "Leitor de memória compartilhada LMU não disponível")
+class TestLMUSharedMemoryReader(unittest.TestCase):
+    """Testes do leitor LMU/rF2 sobre arquivos temporários mapeados como a memória do plugin."""
+
+    def setUp(self):
+        """Cria as páginas de telemetria e scoring do plugin e conecta o leitor."""
+        self.test_dir = tempfile.mkdtemp()
+        self.telemetry = lmu.rF2VehicleTelemetry()
+        self.telemetry.mID = 7
+        self.telemetry.mElapsedTime = 1.0
+        self.scoring = lmu.rF2ScoringInfo()
+        self.scoring.mTrackName[:3] = b"spa"
+        self.scoring.mNumVehicles = 2
+        self.scoring.mCurrentET = 1.0
+        self.scoring.mVehicles[0].mID = 3
+        self.scoring.mVehicles[1].mID = 7
+        self.scoring.mVehicles[1].mIsPlayer = 1
+        self.scoring.mVehicles[1].mLapDist = 1234.5
+        self.scoring.mVehicles[1].mTimeIntoLap = 42.25
+        self.scoring.mVehicles[1].mSector = 2
+        self.scoring.mVehicles[1].mTotalLaps = 3
+        self.scoring.mVehicles[1].mLastLapTime = 95.5
+        for name, page in ((lmu.rFactor2Constants.MM_TELEMETRY_FILE_NAME, self.telemetry),
+                           (lmu.rFactor2Constants.MM_SCORING_FILE_NAME, self.scoring)):
+            size = ctypes.sizeof(page)
+            with open(os.path.join(self.test_dir, name), "wb") as f:
+                f.write(bytes(page) + b"\0" * ((-size) % mmap.PAGESIZE))
+
+        patcher = patch.object(lmu, "_LINUX_SHM_DIR", self.test_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.reader = lmu.LMUSharedMemoryReader()
+        self.assertTrue(self.reader.connect())
+
+    def tearDown(self):
+        """Limpeza após os testes."""
+        self.reader.disconnect()
+        shutil.rmtree(self.test_dir)
+
+    def _write(self, name, page, field, fmt, value):
+        """Simula o plugin gravando um campo da página `name` na memória compartilhada."""
+        with open(os.path.join(self.test_dir, name), "r+b") as f:
+            f.seek(getattr(page, field).offset)
+            f.write(struct.pack(fmt, value))
+
+    def _write_telemetry(self, field, fmt, value):
+        self._write(lmu.rFactor2Constants.MM_TELEMETRY_FILE_NAME, lmu.rF2VehicleTelemetry, field, fmt, value)
+
+    def _write_scoring(self, field, fmt, value):
+        self._write(lmu.rFactor2Constants.MM_SCORING_FILE_NAME, lmu.rF2ScoringInfo, field, fmt, value)
+
+    def _write_vehicle_id(self, index, vehicle_id):
+        """Grava o mID do veículo `index` de mVehicles no scoring."""
+        offset = lmu._VEHICLES_OFFSET + index * lmu._VEHICLE_SIZE + lmu.rF2VehicleScoring.mID.offset
+        with open(os.path.join(self.test_dir, lmu.rFactor2Constants.MM_SCORING_FILE_NAME), "r+b") as f:
+            f.seek(offset)
+            f.write(struct.pack("=i", vehicle_id))
+
+    def test_snapshot_rejects_write_started_mid_copy(self):
+        """Testa que uma escrita iniciada durante a cópia descarta o snapshot e tenta de novo."""
+        real_memmove = ctypes.memmove
+        calls = []
+
+        def memmove_during_write(destination, source, size):
+            result = real_memmove(destination, source, size)
+            calls.append(size)
+            if len(calls) == 1:
+                # O plugin começa um pacote logo depois de o cabeçalho ter sido copiado
+                self._write_telemetry("mVersionUpdateBegin", "=I", 1)
+                self._write_telemetry("mElapsedTime", "=d", 2.0)
+            elif len(calls) == 2:
+                # ...e termina antes da próxima tentativa
+                self._write_telemetry("mVersionUpdateEnd", "=I", 1)
+            return result
+
+        with patch.object(lmu.ctypes, "memmove", side_effect=memmove_during_write):
+            self.assertTrue(self.reader._snapshot_telemetry())
+            # Na 1ª cópia Begin == End: só o Begin relido da memória compartilhada revela a escrita
+            self.assertEqual(len(calls), 3)
+        snapshot = self.reader.telemetry_data
+        self.assertEqual((snapshot.mVersionUpdateBegin, snapshot.mVersionUpdateEnd), (1, 1))
+        self.assertEqual(snapshot.mElapsedTime, 2.0)
+
+        # Com o plugin parado no meio de uma escrita, todas as tentativas são descartadas
+        self._write_telemetry("mVersionUpdateBegin", "=I", 2)
+        self.assertFalse(self.reader._snapshot_telemetry())
+        print("✓ Snapshot da telemetria LMU rejeitando cópias rasgadas")
+
+    def test_refresh_player_version_block(self):
+        """Testa que o scoring do jogador só é aceito fora de uma escrita do plugin."""
+        reader = self.reader
+        self.assertTrue(reader._refresh_player())
+        self.assertEqual(reader.player_fields, (1234.5, 42.25, 2, 3, 95.5))
+        self.assertEqual(reader.player_scoring.mID, 7)
+        self.assertEqual(reader.last_scoring_time, 1.0)
+
+        # Plugin no meio de uma escrita (Begin != End): o pacote é descartado
+        self._write_scoring("mVersionUpdateBegin", "=I", 1)
+        self._write_scoring("mCurrentET", "=d", 2.0)
+        self.assertFalse(reader._refresh_player())
+        self.assertEqual(reader.last_scoring_time, 1.0)
+
+        # Escrita que começa durante a leitura dos campos: Begin relido no fim denuncia
+        self._write_scoring("mVersionUpdateEnd", "=I", 1)
+        find_player_scoring = reader._find_player_scoring
+
+        def find_during_write():
+            self._write_scoring("mVersionUpdateBegin", "=I", 2)
+            return find_player_scoring()
+
+        with patch.object(reader, "_find_player_scoring", side_effect=find_during_write):
+            self.assertFalse(reader._refresh_player())
+        self.assertEqual(reader.last_scoring_time, 1.0)
+
+        # Escrita concluída: o novo pacote é aceito
+        self._write_scoring("mVersionUpdateEnd", "=I", 2)
+        self.assertTrue(reader._refresh_player())
+        self.assertEqual(reader.last_scoring_time, 2.0)
+        print("✓ Bloco de versão do scoring LMU funcionando corretamente")
+
+    def test_find_player_scoring(self):
+        """Testa a busca do jogador em mVehicles e o reaproveitamento do índice."""
+        reader = self.reader
+        self.assertEqual(reader._find_player_scoring().mID, 7)
+        self.assertEqual(reader._player_index, 1)
+
+        # Veículos reordenados: o índice em cache deixa de valer e a coluna mID é varrida
+        self._write_vehicle_id(0, 7)
+        self._write_vehicle_id(1, 3)
+        self.assertEqual(reader._find_player_scoring().mID, 7)
+        self.assertEqual(reader._player_index, 0)
+
+        # Jogador fora de mNumVehicles
+        self._write_scoring("mNumVehicles", "=i", 0)
+        self.assertIsNone(reader._find_player_scoring())
+        self.assertEqual(reader._player_index, -1)
+        print("✓ Busca do jogador no scoring LMU funcionando corretamente")
+
+    def test_struct_converter_and_records(self):
+        """Testa a conversão das estruturas, a decodificação de strings e a serialização dos pontos."""
+        scoring = lmu.struct_converter(lmu.rF2ScoringInfo)(self.reader.scoring_data)
+        self.assertIs(lmu.struct_converter(lmu.rF2ScoringInfo), lmu.struct_converter(lmu.rF2ScoringInfo))
+        self.assertEqual(scoring["mTrackName"], "spa")
+        self.assertEqual([vehicle["mID"] for vehicle in scoring["mVehicles"]], [3, 7]) # Só os ocupados
+        self.assertEqual(scoring["mVehicles"][1]["mLastLapTime"], 95.5)
+        for skipped in ("mVersionUpdateBegin", "mVersionUpdateEnd", "mBytesUpdatedHint", "mResultsStream"):
+            self.assertNotIn(skipped, scoring)
+        telemetry = lmu.struct_converter(lmu.rF2VehicleTelemetry)(self.reader.telemetry_data)
+        self.assertEqual((telemetry["mID"], telemetry["mElapsedTime"]), (7, 1.0))
+        self.assertEqual(telemetry["mPos"], {"x": 0.0, "y": 0.0, "z": 0.0})
+
+        self.assertEqual(lmu._decode_cstring(b"spa\x00lixo"), "spa")
+        self.assertEqual(lmu._decode_cstring(b"\xffspa"), "spa") # Bytes inválidos são ignorados
+        self.assertEqual(lmu.decode_string(self.scoring.mTrackName), "spa")
+
+        records = np.zeros(2, dtype=DP_DTYPE)
+        records["timestamp_ms"] = [1000, 2000]
+        records["gear"] = [3, 4]
+        records["speed_kmh"] = [150.5, 151.25]
+        points = records_to_dicts(records)
+        self.assertEqual([tuple(point) for point in points], [DP_FIELDS] * 2)
+        self.assertEqual([point["timestamp_ms"] for point in points], [1000, 2000])
+        self.assertEqual([point["speed_kmh"] for point in points], [150.5, 151.25])
+        self.assertIs(type(points[0]["gear"]), int) # Tipos nativos, prontos para JSON
+        print("✓ Conversão de estruturas LMU funcionando corretamente")
+
+
 def run_tests():
     """Executa os testes automatizados."""
     print("\n=== Iniciando testes do Race Telemetry Analyzer ===\n")
@@ -359,6 +815,10 @@ def run_tests():
     test_suite.addTest(unittest.makeSuite(TestACCTelemetryCapture))
     test_suite.addTest(unittest.makeSuite(TestLMUTelemetryCapture))
     test_suite.addTest(unittest.makeSuite(TestSetupManagement))
+    test_suite.addTest(unittest.makeSuite(TestMotecParser))
+    test_suite.addTest(unittest.makeSuite(TestTelemetryNormalizer))
+    test_suite.addTest(unittest.makeSuite(TestLapRecorder))
+    test_suite.addTest(unittest.makeSuite(TestLMUSharedMemoryReader))
     
     result = runner.run(test_suite)
     